@@ -1,9 +1,11 @@
 import asyncio
+import functools
 import time
 import hashlib
-import json
 import logging
+import orjson
 import os
+import re
 import requests
 import httpx
 import xml.etree.ElementTree as ET
@@ -19,6 +21,8 @@ import redis.asyncio as redis
 
 from app.config import settings
 from app.services.email_service import EmailService
+from src.infrastructure.ai import _json
+from src.infrastructure.ai._http import get_shared_client
 
 # --- Prompts ---
 SUMMARY_SYSTEM_PROMPT = """
@@ -276,6 +280,23 @@ class GroqServiceError(Exception): pass
 class PubMedError(Exception): pass
 class JSONDecodeError(Exception): pass
 
+# --- JSON Parsing ---
+# Compiled once; finds a JSON object wrapped in prose or code fences
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+def _parse_llm_json(text: str) -> Any:
+    """
+    Parses an LLM reply as JSON. If the reply is not pure JSON, retries on the
+    outermost {...} it contains; raises orjson.JSONDecodeError if neither parses.
+    """
+    try:
+        return _json.loads(text)
+    except orjson.JSONDecodeError:
+        match = _JSON_OBJECT_RE.search(text)
+        if not match:
+            raise
+        return _json.loads(match.group(0))
+
 class CacheService:
     def __init__(self):
         self.redis = None
@@ -315,6 +336,37 @@ class CacheService:
 
 cache_service = CacheService()
 
+# --- Shared SDK clients ---
+# Built once per process on the shared httpx pool (explicit Limits in _http.py),
+# so per-request UnifiedLLMService instances reuse warm connections.
+@functools.lru_cache(maxsize=None)
+def _get_groq_client() -> Optional[AsyncGroq]:
+    if not settings.groq_api_key:
+        return None
+    return AsyncGroq(api_key=settings.groq_api_key, http_client=get_shared_client())
+
+@functools.lru_cache(maxsize=None)
+def _get_openrouter_client() -> Optional[AsyncOpenAI]:
+    if not settings.openrouter_api_key:
+        return None
+    return AsyncOpenAI(
+        base_url="https://openrouter.ai/api/v1",
+        api_key=settings.openrouter_api_key,
+        http_client=get_shared_client()
+    )
+
+@functools.lru_cache(maxsize=None)
+def _get_openai_client() -> Optional[AsyncOpenAI]:
+    if not settings.openai_api_key:
+        return None
+    return AsyncOpenAI(api_key=settings.openai_api_key, http_client=get_shared_client())
+
+def close_clients() -> None:
+    """Drops the shared clients so they are rebuilt on the next (re-opened) pool."""
+    _get_groq_client.cache_clear()
+    _get_openrouter_client.cache_clear()
+    _get_openai_client.cache_clear()
+
 class PubMedService:
     def __init__(self):
         # Entrez.email = settings.ncbi_email # Deprecated
@@ -339,7 +391,7 @@ class PubMedService:
         cached = await cache_service.get(cache_key)
         if cached:
             logger.info(f"PUBMED | CACHE HIT | {query}")
-            return json.loads(cached)
+            return _json.loads(cached)
 
         logger.info(f"PUBMED | FETCHING | {query}")
         
@@ -467,7 +519,7 @@ class PubMedService:
                         continue
 
             # Cache for 24h (86400s)
-            await cache_service.set(cache_key, json.dumps(parsed_results), ttl=86400)
+            await cache_service.set(cache_key, _json.dumps(parsed_results), ttl=86400)
             return parsed_results
 
         except httpx.TimeoutException:
@@ -479,15 +531,10 @@ class PubMedService:
 
 class UnifiedLLMService:
     def __init__(self):
-        # Clients
-        self.groq_client = AsyncGroq(api_key=settings.groq_api_key) if settings.groq_api_key else None
-        
-        self.openrouter_client = AsyncOpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=settings.openrouter_api_key
-        ) if settings.openrouter_api_key else None
-        
-        self.openai_client = AsyncOpenAI(api_key=settings.openai_api_key) if settings.openai_api_key else None
+        # Clients (process-wide, see _get_*_client)
+        self.groq_client = _get_groq_client()
+        self.openrouter_client = _get_openrouter_client()
+        self.openai_client = _get_openai_client()
         
         if settings.gemini_api_key:
             genai.configure(api_key=settings.gemini_api_key)
@@ -635,7 +682,7 @@ class UnifiedLLMService:
             # Let's assume the LLM is asked to return the "results" array or a JSON object with specific fields.
             # If the LLM returns a full JSON object, we parse it.
             
-            parsed_llm = json.loads(llm_output)
+            parsed_llm = _parse_llm_json(llm_output)
             
             # If LLM returned the whole structure, we might overwrite metadata
             if "results" in parsed_llm:
@@ -644,7 +691,7 @@ class UnifiedLLMService:
                 # Maybe it returned just the list?
                 results = parsed_llm if isinstance(parsed_llm, list) else []
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # Fallback if LLM output isn't valid JSON (should be handled by caller, but safety here)
             results = [] 
             # We might want to include the raw text somewhere if it failed?
@@ -684,7 +731,7 @@ class UnifiedLLMService:
         cache_key = f"{cache_key_prefix}:{query_hash}:{settings.groq_main_model}" # Includes model version
         cached = await cache_service.get(cache_key)
         if cached:
-            return json.loads(cached)
+            return _json.loads(cached)
 
         # 2. Query Expansion (if applicable - usually done before calling this, but let's assume this is the main entry)
         # Actually, the user's flow says: Query -> Expansion -> PubMed -> Heuristic -> Groq -> JSON
@@ -873,7 +920,7 @@ class UnifiedLLMService:
                 user_query, search_term, model_used, start_time, articles, response_content, fallback_triggered
             )
             return final_json
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.critical("Model failed to produce valid JSON")
             # We could retry here, but for now return error
             return {"error": "Invalid JSON output", "data": []}
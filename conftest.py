@@ -0,0 +1,7 @@
+# Runnable scripts (they need a live backend), not pytest modules
+collect_ignore_glob = [
+    "verify_*.py",
+    "tests/verify_*.py",
+    "test_mp4_upload.py",
+    "test_groq_connection.py",
+]
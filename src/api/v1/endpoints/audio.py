@@ -3,9 +3,11 @@ import os
 import uuid
 import asyncio
 from typing import Optional, Dict
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks, Body
 from fastapi.responses import StreamingResponse
+from src.infrastructure.ai import _json
 from src.infrastructure.ai.factory import TranscriptionProviderFactory
+from src.infrastructure.ai.groq_service import get_groq_service
 from src.core.use_cases.analyze_case import process_case_pipeline
 from src.services.groq_pipeline_service import GroqPipelineService
 
@@ -85,7 +87,7 @@ async def analyze_audio(
         job_store[job_id] = {
             "id": job_id,
             "status": "pending",
-            "submitted_at": str(asyncio.get_event_loop().time()) # simple timestamp
+            "submitted_at": str(asyncio.get_running_loop().time()) # simple timestamp
         }
         
         # Start background task
@@ -108,6 +110,51 @@ async def get_job_status(job_id: str):
         raise HTTPException(status_code=404, detail="Job not found")
     return job
 
+async def run_batch_job(job_id: str, file_path: str):
+    """Background task wrapper for offline chunk processing"""
+    try:
+        job_store[job_id]["status"] = "processing"
+        result = await GroqPipelineService().process_batch(file_path)
+        job_store[job_id]["status"] = "completed"
+        job_store[job_id]["result"] = result
+    except Exception as e:
+        print(f"❌ Batch job {job_id} failed: {e}")
+        job_store[job_id]["status"] = "failed"
+        job_store[job_id]["error"] = str(e)
+
+@router.post("/process-batch")
+async def process_audio_batch(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...)
+):
+    """
+    Offline counterpart of /process-stream: chunk analyses run through the
+    Groq Batch API (cheaper, no rate limits, but slow). Returns a Job ID.
+    """
+    file_ext = os.path.splitext(file.filename)[1]
+    job_id = str(uuid.uuid4())
+    file_location = f"{UPLOAD_DIR}/batch_{job_id}{file_ext}"
+    
+    try:
+        with open(file_location, "wb+") as file_object:
+            shutil.copyfileobj(file.file, file_object)
+            
+        job_store[job_id] = {
+            "id": job_id,
+            "status": "pending",
+            "submitted_at": str(asyncio.get_running_loop().time())
+        }
+        background_tasks.add_task(run_batch_job, job_id, file_location)
+        
+        return {
+            "job_id": job_id,
+            "status": "pending",
+            "message": "Batch processing started. Check /jobs/{id} for results."
+        }
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("/process-stream")
 async def process_audio_stream(
     file: UploadFile = File(...)
@@ -135,3 +182,19 @@ async def process_audio_stream(
         # But if it fails before starting, we can raise HTTP exception.
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/analyze-stream")
+async def analyze_text_stream(text: str = Body(..., embed=True)):
+    """
+    Streams the case analysis of a transcript as NDJSON.
+    Each line is one completed top-level field (title, summary, ...),
+    so clients can render partial results before the model finishes.
+    """
+    async def fields():
+        try:
+            async for key, value in get_groq_service().stream_case_analysis(text):
+                yield _json.dumps({key: value}) + "\n"
+        except Exception as e:
+            print(f"❌ Analysis Stream Error: {e}")
+            yield _json.dumps({"error": str(e)}) + "\n"
+
+    return StreamingResponse(fields(), media_type="application/x-ndjson")
@@ -28,17 +28,18 @@ UPLOAD_DIR = "uploads"
 if not os.path.exists(UPLOAD_DIR):
     os.makedirs(UPLOAD_DIR)
 
+_CHIEF_COMPLAINT_PATTERNS = [
+    re.compile(r"chief complaint\s*[:\-]\s*(.+)", re.IGNORECASE),
+    re.compile(r"presenting complaint\s*[:\-]\s*(.+)", re.IGNORECASE),
+    re.compile(r"reason for visit\s*[:\-]\s*(.+)", re.IGNORECASE),
+]
+
 
 def extract_chief_complaint(text: Optional[str]) -> Optional[str]:
     if not text:
         return None
-    patterns = [
-        r"chief complaint\s*[:\-]\s*(.+)",
-        r"presenting complaint\s*[:\-]\s*(.+)",
-        r"reason for visit\s*[:\-]\s*(.+)",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, flags=re.IGNORECASE)
+    for pattern in _CHIEF_COMPLAINT_PATTERNS:
+        match = pattern.search(text)
         if match:
             complaint = match.group(1).strip()
             complaint = complaint.split("\n")[0].strip()
@@ -359,7 +360,7 @@ async def analyze_case(
 
     # Optimization: Check Redis Cache first
     cache_key = f"case_analysis:{case_id}:{provider}"
-    cached_result = cache.get(cache_key)
+    cached_result = await cache.get(cache_key)
     if cached_result:
         # If we have a cached result, we might want to ensure the DB is consistent, 
         # but for now, we trust the cache or assume DB is already updated if cache exists.
@@ -496,7 +497,7 @@ async def analyze_case(
         }
         
         # Cache the result
-        cache.set(cache_key, result, ttl=3600 * 24) # Cache for 24 hours
+        await cache.set(cache_key, result, ttl=3600 * 24) # Cache for 24 hours
         
         return result
         
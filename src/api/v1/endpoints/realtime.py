@@ -1,9 +1,9 @@
 import asyncio
 import logging
-import json
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from src.infrastructure.ai import _json
 from src.infrastructure.ai.buffer_manager import BufferManager
-from src.infrastructure.ai.groq_service import GroqService
+from src.infrastructure.ai.groq_service import get_groq_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -18,7 +18,7 @@ async def websocket_endpoint(websocket: WebSocket):
     
     async def process_audio():
         buffer_manager = BufferManager()
-        groq_service = GroqService()
+        groq_service = get_groq_service()
         last_transcription = ""
         
         try:
@@ -30,13 +30,13 @@ async def websocket_endpoint(websocket: WebSocket):
                 # Check queue backlog
                 qsize = queue.qsize()
                 if qsize > 10:
-                    logger.warning(f"Audio processing queue backlog: {qsize} items")
+                    logger.warning("Audio processing queue backlog: %d items", qsize)
                     
                 try:
                     window_payload = buffer_manager.add_audio(data)
                     
                     if window_payload:
-                        logger.info(f"Processing window: {len(window_payload)} bytes")
+                        logger.info("Processing window: %d bytes", len(window_payload))
                         
                         start_time = asyncio.get_running_loop().time()
                         
@@ -48,17 +48,17 @@ async def websocket_endpoint(websocket: WebSocket):
                         
                         duration = asyncio.get_running_loop().time() - start_time
                         if duration > 2.0:
-                            logger.info(f"Groq transcription took {duration:.2f}s")
+                            logger.info("Groq transcription took %.2fs", duration)
                         
                         if new_text:
-                            logger.info(f"Transcribed: {new_text}")
+                            logger.info("Transcribed: %s", new_text)
                             last_transcription = new_text
                             
-                            await websocket.send_json({
+                            await websocket.send_text(_json.dumps({
                                 "type": "transcription",
                                 "text": new_text,
                                 "partial": False
-                            })
+                            }))
                 except Exception as e:
                     logger.error(f"Error in processing audio chunk: {e}")
                     # Don't crash the loop on processing error
@@ -12,6 +12,7 @@ class Settings(BaseSettings):
     GROQ_API_KEY: str = ""
     GROQ_MODEL: str = "llama-3.3-70b-versatile"
     GROQ_AUDIO_MODEL: str = "whisper-large-v3-turbo"
+    GROQ_CONCURRENCY: int = 4  # Parallel Groq calls per processing stream
     REDIS_URL: str = "redis://localhost:6379/0"
 
     # Audio Settings
@@ -23,6 +24,19 @@ class Settings(BaseSettings):
     WINDOW_DURATION: float = 4.0  # Seconds of audio to send to Groq
     OVERLAP_DURATION: float = 1.0  # Seconds to overlap between windows
     SILENCE_THRESHOLD: float = 0.5 # Seconds of silence to trigger flush
+    # Decoded 16 kHz PCM of processed uploads, keyed by file hash. Opt-in: set an
+    # absolute directory to enable; entries expire after the TTL and the total is size-capped.
+    PCM_CACHE_DIR: str = ""
+    PCM_CACHE_TTL: int = 24 * 3600  # seconds
+    PCM_CACHE_MAX_BYTES: int = 2 * 1024 ** 3
+
+    # Streaming transcription (LocalAgreement-2): new audio per pass and the cap on
+    # audio re-sent per pass. Groq receives up to BUFFER / STEP times the input audio.
+    STREAM_STEP_SECONDS: int = 10
+    STREAM_MAX_BUFFER_SECONDS: int = 20
+
+    # Local Whisper Settings
+    WHISPER_BEAM_SIZE: int = 1  # 1 = greedy decoding; raise for quality at the cost of speed
 
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -1,6 +1,6 @@
 import asyncio
 from typing import Dict, Any
-from src.infrastructure.ai.groq_service import GroqService
+from src.infrastructure.ai.groq_service import get_groq_service
 
 async def process_case_pipeline(file_path: str, mime_type: str) -> Dict[str, Any]:
     """
@@ -11,7 +11,7 @@ async def process_case_pipeline(file_path: str, mime_type: str) -> Dict[str, Any
     1. Transcribe (Whisper-large-v3-turbo)
     2. Comprehensive Analysis (Llama-3.3-70b-versatile)
     """
-    service = GroqService()
+    service = get_groq_service()
     
     # 1. Transcribe
     print("🎙️ Groq Transcription (whisper-large-v3-turbo)...")
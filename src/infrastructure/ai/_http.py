@@ -0,0 +1,28 @@
+import httpx
+from typing import Optional
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    One connection pool shared by every AI SDK client (Groq, OpenAI), so
+    keep-alive connections and TLS sessions are reused across providers and requests.
+    Recreated lazily if it was closed at a previous shutdown.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=60.0,
+            # Keep idle connections around long enough to bridge gaps between chunks/requests
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=100, keepalive_expiry=60)
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Closes the shared pool; called from the FastAPI shutdown hook."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
@@ -0,0 +1,13 @@
+from typing import Any
+
+import orjson
+
+
+def loads(data: Any) -> Any:
+    """Parses a JSON document from str or bytes."""
+    return orjson.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Serializes a request payload to a str, keeping non-ASCII text unescaped."""
+    return orjson.dumps(obj).decode()
@@ -0,0 +1,73 @@
+import functools
+from collections import Counter
+import httpx
+import groq
+import openai
+from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential_jitter, retry_if_exception
+
+RETRYABLE_ERRORS = (
+    httpx.ConnectError, httpx.ReadTimeout, httpx.ConnectTimeout, httpx.PoolTimeout,
+    groq.APIConnectionError, groq.RateLimitError, groq.APIStatusError,
+    openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError,
+)
+
+# Client errors worth retrying; any other 4xx (bad request, auth, ...) fails the same way again
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if not isinstance(exc, RETRYABLE_ERRORS):
+        return False
+    status = getattr(exc, "status_code", None)
+    return status is None or status >= 500 or status in RETRYABLE_STATUS_CODES
+
+
+# Shared retry policy; copied per failing call since tenacity keeps per-run state on the object
+_RETRY_POLICY = AsyncRetrying(
+    stop=stop_after_attempt(3),
+    # Jitter de-synchronizes concurrent callers so retries don't arrive in lockstep
+    wait=wait_exponential_jitter(initial=2, max=10, jitter=2),
+    retry=retry_if_exception(is_retryable),
+    # Surface the provider's own error once attempts run out, not tenacity's RetryError
+    reraise=True
+)
+
+
+# Max calls per provider module that may be retrying at once. Past this, a failing
+# call raises immediately so callers fall back instead of piling more retries on
+# an already struggling provider.
+RETRY_BUDGET = 20
+_retries_in_flight: Counter = Counter()
+
+
+def retry_on_failure(func):
+    """
+    Retries `func` with the policy shared by every LLM service.
+    The first attempt runs directly, so the tenacity state machine is only
+    entered once a retryable exception has actually surfaced, and only while
+    the provider's retry budget has room.
+    """
+    provider = func.__module__
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except RETRYABLE_ERRORS as e:
+            if not is_retryable(e) or _retries_in_flight[provider] >= RETRY_BUDGET:
+                raise
+            first_error = e
+
+        _retries_in_flight[provider] += 1
+        try:
+            async for attempt in _RETRY_POLICY.copy():
+                with attempt:
+                    if first_error is not None:
+                        # Replay the first failure so waits and attempt counts match the policy
+                        error, first_error = first_error, None
+                        raise error
+                    return await func(*args, **kwargs)
+        finally:
+            _retries_in_flight[provider] -= 1
+
+    return wrapper
@@ -36,9 +36,13 @@ class AIServiceRouter:
             # So we raise the error instead of falling back.
             raise e
 
-    async def summarize_with_fallback(self, text: str, preferred_provider: str = "gemini") -> Dict[str, Any]:
+    async def summarize_with_fallback(self, text: str, preferred_provider: str = "gemini", hedge_after: Optional[float] = None) -> Dict[str, Any]:
         """
         Summarize text with fallback: Gemini -> OpenAI
+
+        With `hedge_after` set, the fallback is also started once the current provider
+        has been silent for that many seconds (a hedged request), and whichever
+        succeeds first wins; the slower call is cancelled.
         """
         # Default chain: Gemini -> OpenAI
         chain = ["gemini", "openai"]
@@ -48,24 +52,36 @@ class AIServiceRouter:
         # We'll respect preferred_provider if passed, but default to Gemini.
         if preferred_provider == "openai":
             chain = ["openai", "gemini"]
-            
+
+        summarizers = {
+            "gemini": gemini_service.summarize_text,
+            "openai": openai_service.summarize_text
+        }
+        running: Dict[asyncio.Task, str] = {}
         last_error = None
-        
-        for provider_name in chain:
-            try:
-                if provider_name == "gemini":
-                    result = await gemini_service.summarize_text(text)
-                elif provider_name == "openai":
-                    result = await openai_service.summarize_text(text)
-                else:
-                    continue
-                    
-                result["provider"] = provider_name
-                return result
-            except Exception as e:
-                print(f"⚠️ {provider_name.upper()} Summarization failed: {e}")
-                last_error = e
-                continue
+
+        try:
+            for i, provider_name in enumerate(chain):
+                running[asyncio.create_task(summarizers[provider_name](text))] = provider_name
+                # The last provider has no one to hand over to, so just wait it out
+                timeout = hedge_after if i < len(chain) - 1 else None
+
+                while running:
+                    done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        name = running.pop(task)
+                        if task.exception() is None:
+                            result = task.result()
+                            result["provider"] = name
+                            return result
+                        print(f"⚠️ {name.upper()} Summarization failed: {task.exception()}")
+                        last_error = task.exception()
+                    if i < len(chain) - 1:
+                        # Failed or too slow: bring in the next provider
+                        break
+        finally:
+            for task in running:
+                task.cancel()
                 
         raise last_error if last_error else Exception("All summarization providers failed.")
 
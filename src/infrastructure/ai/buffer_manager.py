@@ -9,69 +9,121 @@ class BufferManager:
         # Memory Optimization: Use predefined capacity to avoid resizing
         self.sample_rate = settings.SAMPLE_RATE
         self.bytes_per_sample = 2
-        self.bytes_per_second = self.sample_rate * self.bytes_per_sample
-        
-        # Max buffer size: 30 seconds
-        self.max_buffer_size = 30 * self.bytes_per_second
-        self.buffer = bytearray()
-        
-        self.window_size_bytes = int(settings.WINDOW_DURATION * self.bytes_per_second)
-        self.overlap_size_bytes = int(settings.OVERLAP_DURATION * self.bytes_per_second)
-        
+
+        # All sizes are canonical sample counts; bytes only appear at the I/O boundary
+        self.max_buffer_size = 30 * self.sample_rate  # Max buffer size: 30 seconds
+        self.window_size = int(settings.WINDOW_DURATION * self.sample_rate)
+        self.overlap_size = int(settings.OVERLAP_DURATION * self.sample_rate)
+        self.hop_size = self.window_size - self.overlap_size
+        self.window_bytes = self.window_size * self.bytes_per_sample
+
         self.vad_service = VADService()
-        self.overlap_buffer = bytearray()
+
+        # Preallocated staging area laid out as [overlap | pending audio].
+        # The next payload (overlap + window) therefore always starts at sample 0
+        # and can be handed out as a single contiguous view.
+        self._np = np.zeros(self.overlap_size + self.max_buffer_size, dtype=np.int16)
+        self._overlap_len = 0   # samples of overlap at the front
+        self._pending_len = 0   # samples of not-yet-consumed audio after the overlap
+        self._hop_due = False   # a window was handed out; slide before the next write
+        self._partial = b""     # trailing half-sample carried over to the next chunk
+
+    @property
+    def buffer(self) -> memoryview:
+        """Pending (not yet windowed) audio as bytes."""
+        self._advance()
+        return self._np[self._overlap_len:self._overlap_len + self._pending_len].view(np.uint8).data
 
     def add_audio(self, chunk: bytes) -> Optional[bytes]:
         """
-        Adds audio to buffer. 
+        Adds audio to buffer.
         Returns a full window of bytes if ready to process, otherwise None.
         """
+        payload = self.add_audio_np(chunk)
+        if payload is None:
+            return None
+        return payload.tobytes()
+
+    def add_audio_np(self, chunk: bytes) -> Optional[np.ndarray]:
+        """
+        Same as add_audio, but returns the window as a zero-copy int16 view.
+        The view is only valid until the next add_audio/add_audio_np/flush call.
+        """
+        self._advance()
+
+        if self._partial:
+            chunk = self._partial + chunk
+            self._partial = b""
+        if len(chunk) % self.bytes_per_sample:
+            # Defer the half-sample so the buffer stays sample-aligned
+            self._partial = chunk[-1:]
+            chunk = chunk[:-1]
+        samples = np.frombuffer(chunk, dtype=np.int16)
+
         # Safety check for memory leak
-        if len(self.buffer) + len(chunk) > self.max_buffer_size:
-            # Drop oldest data if overflow (circular buffer behavior simulation)
-            overflow = (len(self.buffer) + len(chunk)) - self.max_buffer_size
-            self.buffer = self.buffer[overflow:]
-            
-        self.buffer.extend(chunk)
-        
+        if samples.size > self.max_buffer_size:
+            samples = samples[-self.max_buffer_size:]
+        overflow = self._pending_len + samples.size - self.max_buffer_size
+        if overflow > 0:
+            # Drop oldest data if overflow (circular buffer behavior)
+            self._drop_pending(overflow)
+
+        start = self._overlap_len + self._pending_len
+        self._np[start:start + samples.size] = samples
+        self._pending_len += samples.size
+
         # Check if we have enough data for a full window
-        if len(self.buffer) >= self.window_size_bytes:
-            return self._extract_window()
-        
+        if self._pending_len >= self.window_size:
+            return self._np[:self._extract_window()]
+
         return None
 
-    def _extract_window(self) -> bytes:
+    def _extract_window(self) -> int:
         """
-        Extracts the current window + overlap from previous.
-        Uses memoryview for zero-copy slicing where possible in future optimization.
-        Currently ensures safe bytes return.
+        Marks the current window (+ overlap from previous) as handed out.
+        The payload is the first `overlap + window` samples of the staging area;
+        sliding is deferred so the returned view stays valid until the next call.
         """
-        # Current window content
-        current_window = self.buffer[:self.window_size_bytes]
-        
-        # Construct payload: Overlap + Current
-        full_payload = self.overlap_buffer + current_window
-        
-        # Update Overlap: Last N bytes of current window
-        new_overlap = current_window[-self.overlap_size_bytes:]
-        self.overlap_buffer = bytearray(new_overlap)
-        
-        # Slide Buffer: Remove (Window - Overlap)
-        # To maintain continuity, we actually just remove the "processed" non-overlapping part?
-        # Standard sliding window: Move forward by hop_size = window - overlap
-        hop_size = self.window_size_bytes - self.overlap_size_bytes
-        self.buffer = self.buffer[hop_size:]
-        
-        return bytes(full_payload)
+        self._hop_due = True
+        return self._overlap_len + self.window_size
+
+    def _advance(self) -> None:
+        """
+        Slides the buffer after a window was handed out.
+        Standard sliding window: Move forward by hop_size = window - overlap,
+        and keep the last `overlap` samples of the window as the new prefix.
+        """
+        if not self._hop_due:
+            return
+        self._hop_due = False
+
+        src = self._overlap_len + self.hop_size
+        remaining = self._pending_len - self.hop_size
+        dst = self.overlap_size
+        # numpy handles the overlapping move like memmove
+        self._np[dst:dst + remaining] = self._np[src:src + remaining]
+        # The new overlap equals the first `overlap` samples of the remaining audio
+        self._np[:dst] = self._np[dst:2 * dst]
+        self._overlap_len = dst
+        self._pending_len = remaining
+
+    def _drop_pending(self, count: int) -> None:
+        count = min(count, self._pending_len)
+        start = self._overlap_len
+        remaining = self._pending_len - count
+        self._np[start:start + remaining] = self._np[start + count:start + count + remaining]
+        self._pending_len = remaining
 
     def flush(self) -> Optional[bytes]:
         """
         Force flush the remaining buffer.
         """
-        if not self.buffer:
+        self._advance()
+        self._partial = b""
+        if not self._pending_len:
             return None
-            
-        full_payload = self.overlap_buffer + self.buffer
-        self.buffer.clear()
-        self.overlap_buffer.clear()
-        return bytes(full_payload)
+
+        full_payload = self._np[:self._overlap_len + self._pending_len].tobytes()
+        self._overlap_len = 0
+        self._pending_len = 0
+        return full_payload
@@ -1,36 +1,72 @@
 import os
+import sys
+import functools
 from typing import Optional
 from src.core.interfaces.transcription_provider import TranscriptionProvider
-from src.infrastructure.ai.groq_provider import GroqTranscriptionProvider
-from src.infrastructure.ai.openai_provider import OpenAITranscriptionProvider
-from src.infrastructure.ai.gemini_provider import GeminiTranscriptionProvider
+from src.infrastructure.ai._http import close_shared_client
+
+_PROVIDER_NAMES = ("groq", "openai", "gemini")
+
+@functools.lru_cache(maxsize=4)
+def get_provider(provider_name: str) -> TranscriptionProvider:
+    """
+    Build (once) the provider for a normalized name.
+    Provider modules are imported lazily so only the SDK actually used gets loaded.
+    """
+    if provider_name == "openai":
+        from src.infrastructure.ai.openai_provider import OpenAITranscriptionProvider
+        return OpenAITranscriptionProvider()
+    elif provider_name == "gemini":
+        from src.infrastructure.ai.gemini_provider import GeminiTranscriptionProvider
+        return GeminiTranscriptionProvider()
+    else:
+        from src.infrastructure.ai.groq_provider import GroqTranscriptionProvider
+        return GroqTranscriptionProvider()
 
 class TranscriptionProviderFactory:
     """
     Factory to create TranscriptionProvider instances.
+    Instances are shared per provider name so their SDK clients and
+    connection pools are reused across requests.
     """
-    
+
     @staticmethod
     def get_provider(provider_name: Optional[str] = None) -> TranscriptionProvider:
         """
         Get a transcription provider instance.
-        
+
         Args:
-            provider_name: 'groq', 'openai', or 'gemini'. 
+            provider_name: 'groq', 'openai', or 'gemini'.
                            If None, uses AI_PROVIDER env var.
         """
         if not provider_name:
             provider_name = os.getenv("AI_PROVIDER", "groq")
-            
+
         provider_name = provider_name.lower()
-        
-        if provider_name == "groq":
-            return GroqTranscriptionProvider()
-        elif provider_name == "openai":
-            return OpenAITranscriptionProvider()
-        elif provider_name == "gemini":
-            return GeminiTranscriptionProvider()
-        else:
+
+        if provider_name not in _PROVIDER_NAMES:
             # Fallback or error
             print(f"⚠️ Unknown provider '{provider_name}', defaulting to Groq")
-            return GroqTranscriptionProvider()
+            provider_name = "groq"
+
+        return get_provider(provider_name)
+
+async def close_all() -> None:
+    """
+    Drops the cached provider/service instances and closes the shared
+    HTTP pool their SDK clients run on. Called at application shutdown.
+    """
+    # Imported here so loading the factory doesn't pull in every SDK
+    from src.infrastructure.ai.groq_service import close_batch_analyzer, get_groq_service
+    from src.infrastructure.ai.openai_service import get_client as get_openai_client
+
+    # Stop the batch worker before the clients it dispatches on are closed
+    await close_batch_analyzer()
+    get_provider.cache_clear()
+    get_groq_service.cache_clear()
+    get_openai_client.cache_clear()
+    # The legacy app's LLM service shares the pool too; only loaded if its routers are mounted
+    legacy_llm = sys.modules.get("app.services.llm_service")
+    if legacy_llm is not None:
+        legacy_llm.close_clients()
+    await close_shared_client()
@@ -1,60 +1,177 @@
 import os
-import json
 from google import genai
 from google.genai import types
 from src.config.settings import settings
+from src.infrastructure.ai.json_stream import iter_json_fields
 
 client = genai.Client(api_key=settings.GOOGLE_API_KEY)
 
-async def generate_case_summary(text: str):
-    """
-    Generate only the case summary (Title, Chief Complaint, History, Vitals) using Gemini.
-    """
-    print("📋 Gemini Summarization (Exclusive)...")
-    response_schema = {
+# Schemas, prompts and configs are built once at import time and reused by every call.
+# Each call keeps its own wording: the model reads these descriptions and prompts.
+_CASE_SUMMARY_SCHEMA = {
+  "type": "OBJECT",
+  "properties": {
+    "title": { "type": "STRING" },
+    "summary": {
       "type": "OBJECT",
       "properties": {
-        "title": { "type": "STRING" },
-        "summary": {
-          "type": "OBJECT",
-          "properties": {
-            "chiefComplaint": { "type": "STRING", "description": "Clean clinical reformulation for the summary page." },
-            "dashboardChiefComplaint": { "type": "STRING", "description": "Very short phrase (3-6 words) for dashboard view. Ex: 'Fever and diarrhea'." },
-            "history": { "type": "STRING", "description": "Clinically rewritten HPI, chronological, no raw transcript." },
-            "vitals": { "type": "STRING", "description": "Structured vital signs if available." },
-          },
-          "required": ["chiefComplaint", "dashboardChiefComplaint", "history", "vitals"],
-        }
+        "chiefComplaint": { "type": "STRING", "description": "Clean clinical reformulation for the summary page." },
+        "dashboardChiefComplaint": { "type": "STRING", "description": "Very short phrase (3-6 words) for dashboard view. Ex: 'Fever and diarrhea'." },
+        "history": { "type": "STRING", "description": "Clinically rewritten HPI, chronological, no raw transcript." },
+        "vitals": { "type": "STRING", "description": "Structured vital signs if available." },
       },
-      "required": ["title", "summary"],
+      "required": ["chiefComplaint", "dashboardChiefComplaint", "history", "vitals"],
     }
+  },
+  "required": ["title", "summary"],
+}
 
-    try:
-        response = client.models.generate_content(
-            model='gemini-2.0-flash',
-            contents=[
-                types.Content(
-                    role="user",
-                    parts=[
-                        types.Part.from_text(text="""You are a pediatric expert assistant. Analyze this morning report transcript. Provide a suitable title and a structured summary.
+_CASE_ANALYSIS_SCHEMA = {
+  "type": "OBJECT",
+  "properties": {
+    "title": { "type": "STRING" },
+    "transcript": { "type": "STRING" },
+    "summary": {
+      "type": "OBJECT",
+      "properties": {
+        "chiefComplaint": { "type": "STRING", "description": "Clean clinical reformulation for summary." },
+        "dashboardChiefComplaint": { "type": "STRING", "description": "Very short phrase (3-6 words) for dashboard. Ex: 'Fever and diarrhea'." },
+        "history": { "type": "STRING", "description": "Clinically rewritten HPI, chronological." },
+        "vitals": { "type": "STRING" },
+      },
+      "required": ["chiefComplaint", "dashboardChiefComplaint", "history", "vitals"],
+    },
+    "differentialDiagnosis": {
+      "type": "ARRAY",
+      "items": { "type": "STRING" },
+    },
+    "keywords": {
+      "type": "ARRAY",
+      "items": { "type": "STRING" },
+    },
+    "nelsonContext": { "type": "STRING" },
+  },
+  "required": ["title", "transcript", "summary", "differentialDiagnosis", "keywords", "nelsonContext"],
+}
+
+_AUDIO_ANALYSIS_SCHEMA = {
+  "type": "OBJECT",
+  "properties": {
+    "title": { "type": "STRING" },
+    "transcript": { "type": "STRING" },
+    "summary": {
+      "type": "OBJECT",
+      "properties": {
+        "chiefComplaint": { "type": "STRING", "description": "Clean clinical reformulation for summary." },
+        "dashboardChiefComplaint": { "type": "STRING", "description": "Very short phrase (3-6 words) for dashboard." },
+        "history": { "type": "STRING", "description": "Clinically rewritten HPI." },
+        "vitals": { "type": "STRING" },
+      },
+      "required": ["chiefComplaint", "dashboardChiefComplaint", "history", "vitals"],
+    },
+    "differentialDiagnosis": {
+      "type": "ARRAY",
+      "items": { "type": "STRING" },
+    },
+    "keywords": {
+      "type": "ARRAY",
+      "items": { "type": "STRING" },
+    },
+    "nelsonContext": { "type": "STRING" },
+  },
+  "required": ["title", "transcript", "summary", "differentialDiagnosis", "keywords", "nelsonContext"],
+}
+
+_CASE_SUMMARY_PROMPT = """You are a pediatric expert assistant. Analyze this morning report transcript. Provide a suitable title and a structured summary.
                         
 STRICT RULES:
 1. Dashboard Chief Complaint: ONLY a very short phrase (3-6 words). Ex: "Fever and diarrhea". NO sentences.
 2. Case Summary Chief Complaint: Clean clinical reformulation. NO raw patient speech.
 3. HPI: Clinically rewritten, chronological. NO raw transcript.
 4. Vitals: Structured if available.
-"""),
-                        types.Part.from_text(text=text)
-                    ]
-                )
-            ],
-            config=types.GenerateContentConfig(
-                response_mime_type="application/json",
-                response_schema=response_schema
-            )
-        )
-        
-        return json.loads(response.text)
+"""
+
+_SUMMARIZE_PROMPT = """You are a pediatric expert assistant. Analyze this morning report transcript.
+                        
+STRICT RULES:
+1. Dashboard Chief Complaint: ONLY a very short phrase (3-6 words). Ex: "Fever and diarrhea".
+2. Case Summary Chief Complaint: Clean clinical reformulation. NO raw patient speech.
+3. HPI: Clinically rewritten, chronological. NO raw transcript.
+4. Vitals: Structured if available.
+"""
+
+_AUDIO_ANALYSIS_PROMPT = """You are a pediatric expert assistant. Listen to this morning report case. Transcribe it, summarize it, list differential diagnoses, provide search keywords, and summarize the relevant section from Nelson Textbook of Pediatrics.
+
+STRICT RULES:
+1. Dashboard Chief Complaint: ONLY a very short phrase (3-6 words). Ex: "Fever and diarrhea".
+2. Case Summary Chief Complaint: Clean clinical reformulation. NO raw patient speech.
+3. HPI: Clinically rewritten, chronological. NO raw transcript.
+4. Vitals: Structured if available.
+"""
+
+_CASE_SUMMARY_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=_CASE_SUMMARY_SCHEMA
+)
+
+_CASE_ANALYSIS_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=_CASE_ANALYSIS_SCHEMA
+)
+
+_AUDIO_ANALYSIS_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=_AUDIO_ANALYSIS_SCHEMA
+)
+
+_SEARCH_CONFIG = types.GenerateContentConfig(
+    tools=[types.Tool(google_search=types.GoogleSearch())]
+)
+
+async def _stream_fields(parts: list, config: types.GenerateContentConfig):
+    """
+    Streams a JSON response from Gemini, yielding top-level (key, value)
+    pairs as soon as each one is complete.
+    """
+    stream = await client.aio.models.generate_content_stream(
+        model='gemini-2.0-flash',
+        contents=[types.Content(role="user", parts=parts)],
+        config=config
+    )
+
+    async def deltas():
+        async for chunk in stream:
+            if chunk.text:
+                yield chunk.text
+
+    async for field in iter_json_fields(deltas()):
+        yield field
+
+def stream_case_summary(text: str):
+    """
+    Stream the case summary fields (title, summary) as Gemini produces them.
+    """
+    return _stream_fields(
+        [types.Part.from_text(text=_CASE_SUMMARY_PROMPT), types.Part.from_text(text=text)],
+        _CASE_SUMMARY_CONFIG
+    )
+
+def stream_summarize_text(text: str):
+    """
+    Stream the full case analysis fields as Gemini produces them.
+    """
+    return _stream_fields(
+        [types.Part.from_text(text=_SUMMARIZE_PROMPT), types.Part.from_text(text=text)],
+        _CASE_ANALYSIS_CONFIG
+    )
+
+async def generate_case_summary(text: str):
+    """
+    Generate only the case summary (Title, Chief Complaint, History, Vitals) using Gemini.
+    """
+    print("📋 Gemini Summarization (Exclusive)...")
+    try:
+        return {key: value async for key, value in stream_case_summary(text)}
         
     except Exception as e:
         print(f"❌ Gemini Summary Failed: {e}")
@@ -65,60 +182,8 @@ async def summarize_text(text: str):
     Summarize text using Gemini Pro.
     """
     print("📋 Gemini Summarization...")
-    response_schema = {
-      "type": "OBJECT",
-      "properties": {
-        "title": { "type": "STRING" },
-        "transcript": { "type": "STRING" },
-        "summary": {
-          "type": "OBJECT",
-          "properties": {
-            "chiefComplaint": { "type": "STRING", "description": "Clean clinical reformulation for summary." },
-            "dashboardChiefComplaint": { "type": "STRING", "description": "Very short phrase (3-6 words) for dashboard. Ex: 'Fever and diarrhea'." },
-            "history": { "type": "STRING", "description": "Clinically rewritten HPI, chronological." },
-            "vitals": { "type": "STRING" },
-          },
-          "required": ["chiefComplaint", "dashboardChiefComplaint", "history", "vitals"],
-        },
-        "differentialDiagnosis": {
-          "type": "ARRAY",
-          "items": { "type": "STRING" },
-        },
-        "keywords": {
-          "type": "ARRAY",
-          "items": { "type": "STRING" },
-        },
-        "nelsonContext": { "type": "STRING" },
-      },
-      "required": ["title", "transcript", "summary", "differentialDiagnosis", "keywords", "nelsonContext"],
-    }
-
     try:
-        response = client.models.generate_content(
-            model='gemini-2.0-flash',
-            contents=[
-                types.Content(
-                    role="user",
-                    parts=[
-                        types.Part.from_text(text="""You are a pediatric expert assistant. Analyze this morning report transcript.
-                        
-STRICT RULES:
-1. Dashboard Chief Complaint: ONLY a very short phrase (3-6 words). Ex: "Fever and diarrhea".
-2. Case Summary Chief Complaint: Clean clinical reformulation. NO raw patient speech.
-3. HPI: Clinically rewritten, chronological. NO raw transcript.
-4. Vitals: Structured if available.
-"""),
-                        types.Part.from_text(text=text)
-                    ]
-                )
-            ],
-            config=types.GenerateContentConfig(
-                response_mime_type="application/json",
-                response_schema=response_schema
-            )
-        )
-        
-        result = json.loads(response.text)
+        result = {key: value async for key, value in stream_summarize_text(text)}
         if not result.get("transcript"):
             result["transcript"] = text
         return result
@@ -136,60 +201,11 @@ async def analyze_audio_case(audio_path: str, mime_type: str = "audio/mp3"):
     with open(audio_path, "rb") as f:
         file_content = f.read()
 
-    # Define schema
-    response_schema = {
-      "type": "OBJECT",
-      "properties": {
-        "title": { "type": "STRING" },
-        "transcript": { "type": "STRING" },
-        "summary": {
-          "type": "OBJECT",
-          "properties": {
-            "chiefComplaint": { "type": "STRING", "description": "Clean clinical reformulation for summary." },
-            "dashboardChiefComplaint": { "type": "STRING", "description": "Very short phrase (3-6 words) for dashboard." },
-            "history": { "type": "STRING", "description": "Clinically rewritten HPI." },
-            "vitals": { "type": "STRING" },
-          },
-          "required": ["chiefComplaint", "dashboardChiefComplaint", "history", "vitals"],
-        },
-        "differentialDiagnosis": {
-          "type": "ARRAY",
-          "items": { "type": "STRING" },
-        },
-        "keywords": {
-          "type": "ARRAY",
-          "items": { "type": "STRING" },
-        },
-        "nelsonContext": { "type": "STRING" },
-      },
-      "required": ["title", "transcript", "summary", "differentialDiagnosis", "keywords", "nelsonContext"],
-    }
-
-    response = client.models.generate_content(
-        model='gemini-2.0-flash',
-        contents=[
-            types.Content(
-                role="user",
-                parts=[
-                    types.Part.from_text(text="""You are a pediatric expert assistant. Listen to this morning report case. Transcribe it, summarize it, list differential diagnoses, provide search keywords, and summarize the relevant section from Nelson Textbook of Pediatrics.
-
-STRICT RULES:
-1. Dashboard Chief Complaint: ONLY a very short phrase (3-6 words). Ex: "Fever and diarrhea".
-2. Case Summary Chief Complaint: Clean clinical reformulation. NO raw patient speech.
-3. HPI: Clinically rewritten, chronological. NO raw transcript.
-4. Vitals: Structured if available.
-"""),
-                    types.Part.from_bytes(data=file_content, mime_type=mime_type)
-                ]
-            )
-        ],
-        config=types.GenerateContentConfig(
-            response_mime_type="application/json",
-            response_schema=response_schema
-        )
-    )
-    
-    return json.loads(response.text)
+    parts = [
+        types.Part.from_text(text=_AUDIO_ANALYSIS_PROMPT),
+        types.Part.from_bytes(data=file_content, mime_type=mime_type)
+    ]
+    return {key: value async for key, value in _stream_fields(parts, _AUDIO_ANALYSIS_CONFIG)}
 
 async def find_pubmed_articles(keywords: list[str]):
     query = f"Find PubMed articles for pediatric case: {', '.join(keywords)}"
@@ -197,27 +213,29 @@ async def find_pubmed_articles(keywords: list[str]):
     response = client.models.generate_content(
         model='gemini-2.0-flash',
         contents=query,
-        config=types.GenerateContentConfig(
-            tools=[types.Tool(google_search=types.GoogleSearch())]
-        )
+        config=_SEARCH_CONFIG
     )
     
     # Parse grounding metadata
     # Python SDK structure might differ slightly from JS
     # Typically response.candidates[0].grounding_metadata
     
-    articles = []
+    seen = set()
+    unique_articles = []
     if response.candidates and response.candidates[0].grounding_metadata:
          chunks = response.candidates[0].grounding_metadata.grounding_chunks
          if chunks:
              for chunk in chunks:
                  if chunk.web and chunk.web.uri and chunk.web.title:
-                     articles.append({
+                     uri = chunk.web.uri
+                     # Deduplicate by URL while collecting
+                     if uri in seen:
+                         continue
+                     seen.add(uri)
+                     unique_articles.append({
                          "title": chunk.web.title,
-                         "url": chunk.web.uri,
+                         "url": uri,
                          "snippet": "Referenced via Google Search Grounding"
                      })
     
-    # Deduplicate
-    unique_articles = {v['url']: v for v in articles}.values()
-    return list(unique_articles)
+    return unique_articles
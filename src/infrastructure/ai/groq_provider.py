@@ -1,7 +1,10 @@
 import os
-from groq import AsyncGroq
+import asyncio
+from pathlib import Path
+from groq import AsyncGroq, APIStatusError
 from src.core.interfaces.transcription_provider import TranscriptionProvider
 from src.config.settings import settings
+from src.infrastructure.ai._http import get_shared_client
 
 class GroqTranscriptionProvider(TranscriptionProvider):
     """
@@ -12,17 +15,15 @@ class GroqTranscriptionProvider(TranscriptionProvider):
         self.api_key = settings.GROQ_API_KEY
         if not self.api_key:
             print("⚠️ GROQ_API_KEY not found. Groq provider may fail.")
-        self.client = AsyncGroq(api_key=self.api_key)
+        self.client = AsyncGroq(api_key=self.api_key, http_client=get_shared_client())
         self.model = settings.GROQ_AUDIO_MODEL # Best for Persian
 
     async def transcribe(self, file_path: str, language: str = "fa") -> str:
         print(f"🎙️ Groq Transcription ({self.model})...")
         try:
-            with open(file_path, "rb") as file:
-                # Read file content asynchronously or just read it (file io is blocking anyway usually unless using aiofiles, but acceptable for small files or if threadpool used)
-                # For simplicity and since AsyncGroq expects file content or tuple, we read it.
-                content = file.read()
-                
+            # Read in a worker thread so the event loop isn't blocked by disk I/O
+            content = await asyncio.to_thread(Path(file_path).read_bytes)
+
             transcription = await self.client.audio.transcriptions.create(
                 file=(os.path.basename(file_path), content),
                 model=self.model,
@@ -33,6 +34,6 @@ class GroqTranscriptionProvider(TranscriptionProvider):
             return transcription.text
         except Exception as e:
             print(f"❌ Groq Transcription Failed: {e}")
-            if hasattr(e, 'status_code') and e.status_code == 401:
+            if isinstance(e, APIStatusError) and e.status_code == 401:
                  raise Exception("Authentication failed: Invalid GROQ_API_KEY.")
             raise e
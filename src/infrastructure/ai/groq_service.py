@@ -1,86 +1,471 @@
 import logging
 import asyncio
+import copy
+import functools
+import hashlib
+import io
+import os
+import re
 import struct
-from typing import Optional
-from groq import AsyncGroq, APIConnectionError, RateLimitError, APIError, APIStatusError
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple
+import numpy as np
+from groq import AsyncGroq, APIStatusError
 from src.config.settings import settings
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type, wait_random
-import httpx
+from src.infrastructure.ai import _json
+from src.infrastructure.ai._http import get_shared_client
+from src.infrastructure.ai._retry import retry_on_failure
+from src.infrastructure.ai._prompts import CASE_ANALYSIS_SYSTEM_PROMPT, BATCH_CASE_ANALYSIS_SYSTEM_PROMPT
+from src.infrastructure.ai.json_stream import iter_json_fields
+from src.infrastructure.cache.redis import cache
 
 logger = logging.getLogger(__name__)
 
+
+TARGET_SAMPLE_RATE = 16000
+RAW_PCM_CONTENT_TYPE = "audio/l16; rate=16000; channels=1"
+# Statuses meaning "unsupported upload format", as opposed to auth or rate-limit errors
+RAW_PCM_REJECTED_STATUSES = (400, 415, 422)
+# Error text that blames the upload format itself (vs. e.g. "audio too short")
+_RAW_PCM_REJECTED_RE = re.compile(
+    r"content.?type|media type|file (?:type|format|extension)|audio/l16"
+    r"|must be one of the following types|unsupported (?:audio |file )?format",
+    re.IGNORECASE,
+)
+# Top-level fields CASE_ANALYSIS_SYSTEM_PROMPT asks for
+CASE_ANALYSIS_FIELDS = frozenset({"title", "summary", "differentialDiagnosis", "keywords", "nelsonContext"})
+
+
+def _spread_words(text: str, start: float, end: float) -> List[Dict[str, Any]]:
+    """Splits text into words with timestamps interpolated evenly over [start, end]."""
+    tokens = text.split()
+    step = (end - start) / len(tokens) if tokens else 0.0
+    return [
+        {"word": token, "start": start + i * step, "end": start + (i + 1) * step}
+        for i, token in enumerate(tokens)
+    ]
+
+
+class _BatchAnalyzer:
+    """
+    Coalesces concurrent analyze_case_comprehensive calls into one Groq request.
+
+    Callers enqueue (service, transcript, future) and await the future. A worker
+    collects up to `max_batch` items arriving within `batch_window` seconds of the
+    first one and sends them together; a lone item uses the single-case path.
+    Futures resolve to (analysis, system prompt that produced it).
+    """
+
+    def __init__(self, max_batch: int = 8, batch_window: float = 0.05):
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: set = set()
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            # Queue and worker are bound to the running loop (one per loop)
+            if self._loop is not loop:
+                self._queue = asyncio.Queue()
+            self._loop = loop
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, service: "GroqService", transcript: str) -> Optional[dict]:
+        result, _ = await self.submit_tagged(service, transcript)
+        return result
+
+    async def submit_tagged(self, service: "GroqService", transcript: str) -> Tuple[Optional[dict], str]:
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((service, transcript, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple["GroqService", str, asyncio.Future]]:
+        batch = [await self._queue.get()]
+        if self._queue.empty():
+            # Nothing else waiting: don't make a lone (interactive) request pay the window
+            return batch
+        deadline = self._loop.time() + self.batch_window
+        try:
+            while len(batch) < self.max_batch:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            # Dispatch without blocking collection of the next batch
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[Tuple["GroqService", str, asyncio.Future]]) -> None:
+        try:
+            # Each service only batches its own cases, over its own client
+            groups: Dict["GroqService", list] = {}
+            for item in batch:
+                groups.setdefault(item[0], []).append(item)
+            await asyncio.gather(*(self._dispatch_group(service, items) for service, items in groups.items()))
+        except asyncio.CancelledError:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+
+    async def _dispatch_group(self, service: "GroqService", batch: List[Tuple["GroqService", str, asyncio.Future]]) -> None:
+        pending = batch
+        if len(batch) > 1:
+            try:
+                results = await service._analyze_batch([transcript for _, transcript, _ in batch])
+                pending = []
+                for i, (svc, transcript, future) in enumerate(batch):
+                    if i in results:
+                        if not future.done():
+                            future.set_result((results[i], BATCH_CASE_ANALYSIS_SYSTEM_PROMPT))
+                    else:
+                        pending.append((svc, transcript, future))
+                if pending:
+                    logger.warning("Groq batch analysis missed %d case(s), retrying individually", len(pending))
+            except Exception:
+                logger.warning("Groq batch analysis failed, falling back to per-case requests")
+                pending = batch
+
+        await asyncio.gather(*(self._dispatch_single(*item) for item in pending))
+
+    async def _dispatch_single(self, service: "GroqService", transcript: str, future: asyncio.Future) -> None:
+        try:
+            result = await service._analyze_single(transcript)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result((result, CASE_ANALYSIS_SYSTEM_PROMPT))
+
+
+    async def close(self) -> None:
+        """
+        Cancels the worker and any in-flight dispatches; callers still
+        waiting on a result get CancelledError.
+        """
+        if self._loop is asyncio.get_running_loop():
+            tasks = [task for task in (self._worker, *self._inflight) if task is not None]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            while not self._queue.empty():
+                _, _, future = self._queue.get_nowait()
+                future.cancel()
+        self._worker = None
+        self._queue = None
+        self._loop = None
+
+
+_batch_analyzer = _BatchAnalyzer()
+
+
+async def close_batch_analyzer() -> None:
+    """Stops the shared batch analyzer worker. Called at application shutdown."""
+    await _batch_analyzer.close()
+
+
+class _AnalysisCache:
+    """
+    Two-level cache for case analyses: an in-process LRU in front of Redis.
+    Keys hash the model and system prompt together with the transcript, so
+    changing either invalidates old entries. Only single-case analyses are
+    stored: a batched result shares its prompt with other patients' cases.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: int = 24 * 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._local: "OrderedDict[str, dict]" = OrderedDict()
+
+    @staticmethod
+    def key(transcript: str, prompt: str) -> str:
+        digest = hashlib.sha256(
+            f"{settings.GROQ_MODEL}\0{prompt}\0{transcript}".encode()
+        ).hexdigest()
+        return f"case_analysis:{digest}"
+
+    async def get(self, key: str) -> Optional[dict]:
+        value = self._local.get(key)
+        if value is not None:
+            self._local.move_to_end(key)
+        else:
+            value = await cache.get(key)
+            if value is None:
+                return None
+            self._remember(key, value)
+        # Callers may modify the analysis, so never hand out the cached object
+        return copy.deepcopy(value)
+
+    async def set(self, key: str, value: dict) -> None:
+        self._remember(key, copy.deepcopy(value))
+        await cache.set(key, value, self.ttl)
+
+    def _remember(self, key: str, value: dict) -> None:
+        self._local[key] = value
+        self._local.move_to_end(key)
+        if len(self._local) > self.maxsize:
+            self._local.popitem(last=False)
+
+
+_analysis_cache = _AnalysisCache()
+
+class _WavStream(io.RawIOBase):
+    """
+    Read-only file-like that serves a WAV header followed by the PCM payload.
+    The PCM is read straight from a memoryview, so the full WAV file is never
+    materialized as a second copy of the audio.
+    """
+
+    def __init__(self, header: bytes, pcm: bytes):
+        self._header = header
+        self._pcm = memoryview(pcm)
+        self._size = len(header) + len(self._pcm)
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        out = memoryview(buffer).cast("B")
+        written = 0
+        header_len = len(self._header)
+        while written < len(out) and self._pos < self._size:
+            if self._pos < header_len:
+                src = memoryview(self._header)[self._pos:]
+            else:
+                src = self._pcm[self._pos - header_len:]
+            n = min(len(src), len(out) - written)
+            out[written:written + n] = src[:n]
+            written += n
+            self._pos += n
+        return written
+
+
+@functools.lru_cache(maxsize=8)
+def _wav_header_template(sample_rate: int = 16000, channels: int = 1, bits_per_sample: int = 16) -> bytes:
+    """
+    Packs a canonical 44-byte PCM WAV header with zeroed length fields.
+    Cached per format; only the two lengths vary between uploads.
+    """
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 0, b'WAVE',
+        # fmt chunk
+        b'fmt ', 16, 1, channels, sample_rate,  # chunk size, PCM format
+        sample_rate * channels * bits_per_sample // 8,  # Byte rate
+        channels * bits_per_sample // 8,  # Block align
+        bits_per_sample,
+        # data chunk
+        b'data', 0
+    )
+
+
+def _downsample_pcm(audio_bytes: bytes, sample_rate: int, channels: int) -> Tuple[bytes, int]:
+    """
+    Downmixes 16-bit PCM to mono and decimates it to 16 kHz, which is all
+    Whisper uses anyway, so we don't upload bytes the model throws away.
+    Returns the converted PCM and its sample rate.
+    """
+    if channels == 1 and sample_rate <= TARGET_SAMPLE_RATE:
+        return audio_bytes, sample_rate
+
+    frame_bytes = 2 * channels
+    samples = np.frombuffer(audio_bytes, dtype=np.int16, count=len(audio_bytes) // frame_bytes * channels)
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+
+    if sample_rate > TARGET_SAMPLE_RATE:
+        if sample_rate % TARGET_SAMPLE_RATE == 0:
+            # Integer ratio (32/48 kHz): average each group, a cheap low-pass + decimate
+            factor = sample_rate // TARGET_SAMPLE_RATE
+            usable = len(samples) - len(samples) % factor
+            samples = samples[:usable].reshape(-1, factor).mean(axis=1)
+        else:
+            # e.g. 44.1 kHz: linear interpolation onto the 16 kHz grid
+            out_len = len(samples) * TARGET_SAMPLE_RATE // sample_rate
+            positions = np.arange(out_len) * (sample_rate / TARGET_SAMPLE_RATE)
+            samples = np.interp(positions, np.arange(len(samples)), samples)
+        sample_rate = TARGET_SAMPLE_RATE
+
+    return np.round(samples).astype(np.int16).tobytes(), sample_rate
+
+
 class GroqService:
+    # Whether Groq accepts headerless PCM uploads. Probed once per process:
+    # None = unknown, True = send raw PCM, False = always wrap in WAV.
+    _server_accepts_raw: Optional[bool] = None
+    # Lets a single request probe the raw path while concurrent ones wait for the verdict
+    _raw_probe_lock = asyncio.Lock()
+    # Models that rejected a json_schema response_format; those get JSON mode instead
+    _json_schema_unsupported: Set[str] = set()
+
     def __init__(self):
-        # Initialize AsyncGroq with custom http client for pooling/timeouts if needed
-        # By default AsyncGroq uses httpx.AsyncClient
+        # AsyncGroq runs on the shared httpx pool so connections are reused
         self.client = AsyncGroq(
             api_key=settings.GROQ_API_KEY,
             timeout=60.0, # Increased to 60s to prevent timeouts
-            max_retries=0 # We handle retries with tenacity
+            max_retries=0, # We handle retries with tenacity
+            http_client=get_shared_client()
         )
         self.model = settings.GROQ_AUDIO_MODEL
         self.language = "fa"
 
     def _create_wav_header(self, data_length: int, sample_rate: int = 16000, channels: int = 1, bits_per_sample: int = 16) -> bytes:
         """Creates a valid WAV header for the given PCM data properties."""
-        header = b'RIFF'
-        header += struct.pack('<I', 36 + data_length)
-        header += b'WAVE'
-        
-        # fmt chunk
-        header += b'fmt '
-        header += struct.pack('<I', 16) # Chunk size
-        header += struct.pack('<H', 1)  # Audio format (1 = PCM)
-        header += struct.pack('<H', channels)
-        header += struct.pack('<I', sample_rate)
-        header += struct.pack('<I', sample_rate * channels * bits_per_sample // 8) # Byte rate
-        header += struct.pack('<H', channels * bits_per_sample // 8) # Block align
-        header += struct.pack('<H', bits_per_sample)
-        
-        # data chunk
-        header += b'data'
-        header += struct.pack('<I', data_length)
-        
-        return header
+        # Copy the cached template for this format and patch only the two length fields
+        header = bytearray(_wav_header_template(sample_rate, channels, bits_per_sample))
+        struct.pack_into('<I', header, 4, 36 + data_length)  # RIFF chunk size
+        struct.pack_into('<I', header, 40, data_length)      # data chunk size
+        return bytes(header)
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.ConnectError, httpx.ReadTimeout, httpx.ConnectTimeout, httpx.PoolTimeout, APIConnectionError, RateLimitError, APIStatusError))
-    )
-    async def chat(self, messages: list, model: Optional[str] = None, json_mode: bool = False) -> Optional[str]:
+    @retry_on_failure
+    async def chat(self, messages: list, model: Optional[str] = None, json_mode: bool = False, json_schema: Optional[dict] = None) -> Optional[str]:
         """
         Sends a chat completion request to Groq.
+        json_schema ({"name": ..., "schema": ...}) requests schema-constrained
+        output; models without structured output support fall back to JSON mode.
         """
         try:
             target_model = model or settings.GROQ_MODEL
-            response_format = {"type": "json_object"} if json_mode else None
-            completion = await self.client.chat.completions.create(
-                model=target_model,
-                messages=messages,
-                temperature=0.5,
-                response_format=response_format
+            if json_schema is not None and target_model not in GroqService._json_schema_unsupported:
+                try:
+                    return await self._complete(messages, target_model, {"type": "json_schema", "json_schema": json_schema})
+                except APIStatusError as e:
+                    if e.status_code != 400:
+                        raise
+                    detail = str(e)
+                    if "json_validate_failed" in detail:
+                        # Supported, but this generation broke the schema; retry it in JSON mode
+                        logger.warning("Groq output failed schema validation, retrying in JSON mode")
+                    elif "response_format" in detail or "json_schema" in detail:
+                        logger.info("Groq model %s rejected json_schema output (%s), using JSON mode", target_model, e.status_code)
+                        GroqService._json_schema_unsupported.add(target_model)
+                    else:
+                        # Unrelated bad request (e.g. context too long); JSON mode would fail the same way
+                        raise
+            response_format = {"type": "json_object"} if json_mode or json_schema is not None else None
+            return await self._complete(messages, target_model, response_format)
+        except Exception as e:
+            logger.error("Groq Chat Error: %s", e)
+            raise e
+
+    async def _complete(self, messages: list, model: str, response_format: Optional[dict]) -> Optional[str]:
+        completion = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.5,
+            response_format=response_format
+        )
+        return completion.choices[0].message.content
+
+    async def chat_stream(self, messages: list, model: Optional[str] = None) -> AsyncGenerator[str, None]:
+        """
+        Streams a chat completion, yielding content deltas as Groq generates them.
+        """
+        stream = await self.client.chat.completions.create(
+            model=model or settings.GROQ_MODEL,
+            messages=messages,
+            temperature=0.5,
+            stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def chat_batch(self, requests: Dict[str, list], model: Optional[str] = None, json_mode: bool = False, poll_interval: float = 10.0, max_poll_interval: float = 120.0) -> Dict[str, str]:
+        """
+        Runs many chat completions as one Groq Batch job and waits for it to finish.
+        `requests` maps a custom id to its messages; returns the reply content per id.
+        Requests that failed inside the batch are missing from the result.
+        Only for work nobody is waiting on: batches may take up to the 24h window.
+        """
+        if not requests:
+            return {}
+
+        body = {"model": model or settings.GROQ_MODEL, "temperature": 0.5}
+        if json_mode:
+            body["response_format"] = {"type": "json_object"}
+        lines = [
+            _json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {**body, "messages": messages}
+            })
+            for custom_id, messages in requests.items()
+        ]
+
+        try:
+            batch_file = await self.client.files.create(file=("batch.jsonl", "\n".join(lines).encode()), purpose="batch")
+            batch = await self.client.batches.create(
+                completion_window="24h",
+                endpoint="/v1/chat/completions",
+                input_file_id=batch_file.id
             )
-            return completion.choices[0].message.content
+
+            # Batches take minutes to hours; back off instead of polling every few seconds
+            delay = poll_interval
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_poll_interval)
+                batch = await self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"Groq batch {batch.id} ended with status {batch.status}")
+
+            output = await self.client.files.content(batch.output_file_id)
+            results = {}
+            for line in (await output.text()).splitlines():
+                if not line.strip():
+                    continue
+                item = _json.loads(line)
+                response = item.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[item["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+            return results
+
         except Exception as e:
-            logger.error(f"Groq Chat Error: {e}")
+            logger.error("Groq Batch Chat Error: %s", e)
             raise e
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.ConnectError, httpx.ReadTimeout, httpx.ConnectTimeout, httpx.PoolTimeout, APIConnectionError, RateLimitError, APIStatusError))
-    )
+    @retry_on_failure
     async def transcribe_file(self, file_path: str, prompt: str = "") -> Optional[str]:
         """
         Transcribes an audio file using Groq Whisper API.
         """
         try:
-            with open(file_path, "rb") as f:
-                # Read file content
-                file_content = f.read()
-                
-            filename = file_path.split("/")[-1]
+            # Read off the event loop so large uploads don't stall other requests
+            file_content = await asyncio.to_thread(Path(file_path).read_bytes)
+            filename = os.path.basename(file_path)
             
             transcription = await self.client.audio.transcriptions.create(
                 file=(filename, file_content),
@@ -94,75 +479,153 @@ class GroqService:
             return transcription.text.strip()
             
         except Exception as e:
-            logger.error(f"Groq File Transcription Error: {e}")
+            logger.error("Groq File Transcription Error: %s", e)
             raise e
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.ConnectError, httpx.ReadTimeout, httpx.ConnectTimeout, httpx.PoolTimeout, APIConnectionError, RateLimitError, APIStatusError))
-    )
     async def analyze_case_comprehensive(self, transcript: str) -> Optional[dict]:
         """
         Performs comprehensive case analysis (Summary + Clinical Analysis) using Llama 3.3.
         Replaces Gemini and OpenAI functionality.
+
+        Concurrent calls are coalesced by the shared batch analyzer so that
+        near-simultaneous cases share a single Groq round-trip. Single-case
+        results are cached by transcript, so a repeated case skips the LLM call.
         """
-        system_prompt = """You are a pediatric expert assistant. Analyze the following morning report case transcript.
-        Return a valid JSON object with the following structure:
-        {
-            "title": "string (A suitable title for the case)",
-            "summary": {
-                "chiefComplaint": "string",
-                "history": "string",
-                "vitals": "string"
-            },
-            "differentialDiagnosis": ["string (Diagnosis 1)", "string (Diagnosis 2)", ...],
-            "keywords": ["string (Keyword 1)", ...],
-            "nelsonContext": "string (Summary of the condition from Nelson Textbook of Pediatrics context)"
-        }
-        Ensure the JSON is valid and strictly follows this schema.
+        key = _analysis_cache.key(transcript, CASE_ANALYSIS_SYSTEM_PROMPT)
+        cached = await _analysis_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result, prompt = await _batch_analyzer.submit_tagged(self, transcript)
+        if result and prompt == CASE_ANALYSIS_SYSTEM_PROMPT:
+            await _analysis_cache.set(key, result)
+        return result
+
+    @retry_on_failure
+    async def _analyze_single(self, transcript: str) -> Optional[dict]:
+        """
+        Analyzes one transcript in its own request. Nothing consumes partial
+        fields here, so this uses non-streamed JSON mode rather than streaming.
         """
-        
         try:
             completion = await self.client.chat.completions.create(
                 model=settings.GROQ_MODEL,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": CASE_ANALYSIS_SYSTEM_PROMPT},
                     {"role": "user", "content": transcript}
                 ],
                 temperature=0.1, # Low temperature for consistent formatting
                 response_format={"type": "json_object"}
             )
-            
-            content = completion.choices[0].message.content
-            import json
-            return json.loads(content)
-            
+            return _json.loads(completion.choices[0].message.content)
+
         except Exception as e:
-            logger.error(f"Groq Comprehensive Analysis Error: {e}")
+            logger.error("Groq Comprehensive Analysis Error: %s", e)
             raise e
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.ConnectError, httpx.ReadTimeout, httpx.ConnectTimeout, httpx.PoolTimeout, APIConnectionError, RateLimitError, APIStatusError))
-    )
-    async def transcribe(self, audio_bytes: bytes, prompt: str = "") -> Optional[str]:
+    async def stream_case_analysis(self, transcript: str) -> AsyncGenerator[Tuple[str, Any], None]:
+        """
+        Streams the comprehensive case analysis, yielding each top-level
+        (key, value) pair (title, summary, ...) as soon as it is complete.
+
+        Groq's JSON mode does not support streaming, so the schema is enforced
+        by the prompt only: text before the opening brace (e.g. a code fence)
+        is skipped, and ValueError is raised if the finished object lacks a
+        required field.
+        """
+        stream = await self.client.chat.completions.create(
+            model=settings.GROQ_MODEL,
+            messages=[
+                {"role": "system", "content": CASE_ANALYSIS_SYSTEM_PROMPT},
+                {"role": "user", "content": transcript}
+            ],
+            temperature=0.1, # Low temperature for consistent formatting
+            stream=True
+        )
+
+        async def deltas():
+            started = False
+            async for chunk in stream:
+                if not (chunk.choices and chunk.choices[0].delta.content):
+                    continue
+                content = chunk.choices[0].delta.content
+                if not started:
+                    brace = content.find("{")
+                    if brace < 0:
+                        continue
+                    content, started = content[brace:], True
+                yield content
+
+        seen = set()
+        async for key, value in iter_json_fields(deltas()):
+            seen.add(key)
+            yield key, value
+
+        missing = CASE_ANALYSIS_FIELDS - seen
+        if missing:
+            raise ValueError(f"Streamed case analysis is missing {', '.join(sorted(missing))}")
+
+    async def _analyze_batch(self, transcripts: List[str]) -> Dict[int, dict]:
+        """
+        Analyzes several transcripts in a single request.
+        Returns analyses keyed by the transcript's position in the batch;
+        cases the model dropped are simply absent from the result.
+        """
+        payload = {"cases": [{"id": i, "transcript": t} for i, t in enumerate(transcripts)]}
+        try:
+            completion = await self.client.chat.completions.create(
+                model=settings.GROQ_MODEL,
+                messages=[
+                    {"role": "system", "content": BATCH_CASE_ANALYSIS_SYSTEM_PROMPT},
+                    {"role": "user", "content": _json.dumps(payload)}
+                ],
+                temperature=0.1,
+                response_format={"type": "json_object"}
+            )
+
+            data = _json.loads(completion.choices[0].message.content)
+            results = {}
+            for item in data.get("cases", []):
+                if not isinstance(item, dict) or not isinstance(item.get("id"), int):
+                    continue
+                case_id = item.pop("id")
+                # Ids must map back one-to-one, or analyses may be attributed to the wrong case
+                if case_id in results or not 0 <= case_id < len(transcripts):
+                    raise ValueError(f"Batch analysis returned duplicate or unknown case id {case_id}")
+                results[case_id] = item
+            return results
+
+        except Exception as e:
+            logger.error("Groq Batch Analysis Error: %s", e)
+            raise e
+
+    @retry_on_failure
+    async def transcribe(self, audio_bytes: bytes, prompt: str = "", sample_rate: int = TARGET_SAMPLE_RATE, channels: int = 1) -> Optional[str]:
         """
         Transcribes audio bytes using Groq Whisper API.
         
         Args:
-            audio_bytes: Raw audio data (PCM 16-bit 16kHz). 
+            audio_bytes: Raw audio data (PCM 16-bit).
                         We wrap this in a WAV container before sending to Groq.
             prompt: Previous context to guide the model.
+            sample_rate: Sample rate of audio_bytes; anything above 16kHz is downsampled.
+            channels: Channel count of audio_bytes; multi-channel audio is downmixed to mono.
         
         Returns:
             Transcribed text or None if failed.
         """
         try:
-            # Add WAV header to raw PCM bytes
-            wav_header = self._create_wav_header(len(audio_bytes))
-            wav_data = wav_header + audio_bytes
+            audio_bytes, sample_rate = _downsample_pcm(audio_bytes, sample_rate, channels)
+
+            # The raw upload declares 16kHz mono in its content type
+            if sample_rate == TARGET_SAMPLE_RATE and GroqService._server_accepts_raw is not False:
+                text = await self._transcribe_raw_pcm(audio_bytes, prompt)
+                if text is not None:
+                    return text
+
+            # Add WAV header to raw PCM bytes (streamed, without concatenating)
+            wav_header = self._create_wav_header(len(audio_bytes), sample_rate=sample_rate)
+            wav_data = _WavStream(wav_header, audio_bytes)
             
             # Groq expects a tuple (filename, file_content)
             file_payload = ("audio.wav", wav_data)
@@ -179,5 +642,90 @@ class GroqService:
             return transcription.text.strip()
             
         except Exception as e:
-            logger.error(f"Groq Transcription Error: {e}")
+            logger.error("Groq Transcription Error: %s", e)
+            raise e
+
+    @retry_on_failure
+    async def transcribe_words(self, audio_bytes: bytes, prompt: str = "") -> List[Dict[str, Any]]:
+        """
+        Transcribes 16kHz mono PCM and returns word-level timestamps:
+        [{"word": str, "start": float, "end": float}, ...] with times in
+        seconds relative to the start of audio_bytes.
+        """
+        try:
+            wav_data = _WavStream(self._create_wav_header(len(audio_bytes)), audio_bytes)
+            transcription = await self.client.audio.transcriptions.create(
+                file=("audio.wav", wav_data),
+                model=self.model,
+                prompt=prompt,
+                language=self.language,
+                temperature=0.0,
+                response_format="verbose_json",
+                timestamp_granularities=["word", "segment"]
+            )
+
+            words = []
+            for w in getattr(transcription, "words", None) or []:
+                if not isinstance(w, dict):
+                    w = {"word": w.word, "start": w.start, "end": w.end}
+                words.append({"word": w["word"].strip(), "start": float(w["start"]), "end": float(w["end"])})
+            if words:
+                return words
+
+            # No word timestamps: spread each segment's words evenly over its span
+            for seg in getattr(transcription, "segments", None) or []:
+                if not isinstance(seg, dict):
+                    seg = {"text": seg.text, "start": seg.start, "end": seg.end}
+                words.extend(_spread_words(seg["text"], float(seg["start"]), float(seg["end"])))
+            if not words and getattr(transcription, "text", None):
+                words = _spread_words(transcription.text, 0.0, len(audio_bytes) / (2 * TARGET_SAMPLE_RATE))
+            return words
+
+        except Exception as e:
+            logger.error("Groq Word Transcription Error: %s", e)
             raise e
+
+    async def _transcribe_raw_pcm(self, audio_bytes: bytes, prompt: str) -> Optional[str]:
+        """
+        Uploads PCM without a WAV container, declaring the format via content type.
+        Returns None if Groq rejects the upload, so the caller can fall back to WAV
+        wrapping; the raw path is disabled for this process only when the error
+        names the upload format.
+        """
+        if GroqService._server_accepts_raw is None:
+            async with GroqService._raw_probe_lock:
+                if GroqService._server_accepts_raw is None:
+                    return await self._upload_raw_pcm(audio_bytes, prompt)
+            if GroqService._server_accepts_raw is False:
+                return None
+        return await self._upload_raw_pcm(audio_bytes, prompt)
+
+    async def _upload_raw_pcm(self, audio_bytes: bytes, prompt: str) -> Optional[str]:
+        try:
+            transcription = await self.client.audio.transcriptions.create(
+                file=("audio.pcm", audio_bytes, RAW_PCM_CONTENT_TYPE),
+                model=self.model,
+                prompt=prompt,
+                language=self.language,
+                temperature=0.0,
+                response_format="json"
+            )
+        except APIStatusError as e:
+            if e.status_code not in RAW_PCM_REJECTED_STATUSES:
+                raise
+            if _RAW_PCM_REJECTED_RE.search(str(e)):
+                logger.info("Groq rejected raw PCM upload (%s), using WAV container", e.status_code)
+                GroqService._server_accepts_raw = False
+            else:
+                # Unrelated to the format (e.g. audio too short): retry this call as WAV only
+                logger.info("Groq raw PCM upload failed (%s): %s; retrying as WAV", e.status_code, e)
+            return None
+
+        GroqService._server_accepts_raw = True
+        return transcription.text.strip()
+
+
+@functools.lru_cache(maxsize=None)
+def get_groq_service() -> GroqService:
+    """Process-wide GroqService, so callers share one SDK client instead of building one per request."""
+    return GroqService()
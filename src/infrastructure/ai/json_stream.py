@@ -0,0 +1,73 @@
+import json
+from typing import Any, AsyncIterator, Tuple
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def _skip(buffer: str, pos: int, chars: str) -> int:
+    while pos < len(buffer) and buffer[pos] in chars:
+        pos += 1
+    return pos
+
+
+async def iter_json_fields(chunks: AsyncIterator[str]) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Incrementally parses a streamed JSON object.
+
+    Yields each top-level (key, value) pair as soon as its value is complete,
+    so callers can start using e.g. "title" before the rest of the response
+    has arrived. Raises ValueError if the stream ends before the object closes.
+    """
+    buffer = ""
+    pos = 0
+    opened = False
+    closed = False
+
+    async for chunk in chunks:
+        if closed:
+            continue
+        buffer += chunk
+
+        if not opened:
+            pos = _skip(buffer, pos, _WHITESPACE)
+            if pos >= len(buffer):
+                continue
+            if buffer[pos] != "{":
+                raise ValueError("Streamed response is not a JSON object")
+            opened = True
+            pos += 1
+
+        while True:
+            pos = _skip(buffer, pos, _WHITESPACE + ",")
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "}":
+                closed = True
+                break
+            try:
+                key, key_end = _decoder.raw_decode(buffer, pos)
+                colon = _skip(buffer, key_end, _WHITESPACE)
+                if colon >= len(buffer):
+                    break
+                if buffer[colon] != ":":
+                    raise ValueError(f"Expected ':' after key {key!r}")
+                value_start = _skip(buffer, colon + 1, _WHITESPACE)
+                value, value_end = _decoder.raw_decode(buffer, value_start)
+            except json.JSONDecodeError:
+                # Value not fully received yet
+                break
+            # Bare numbers/literals are only complete once a delimiter follows
+            if not isinstance(value, (str, dict, list)) and (
+                value_end >= len(buffer) or buffer[value_end] not in _WHITESPACE + ",}"
+            ):
+                break
+            yield key, value
+            pos = value_end
+
+        # Drop consumed text so the buffer only holds the in-flight field
+        buffer = buffer[pos:]
+        pos = 0
+
+    if not closed:
+        raise ValueError("Streamed JSON object ended before it was complete")
@@ -1,7 +1,10 @@
 import os
+import asyncio
+from pathlib import Path
 import openai
 from src.core.interfaces.transcription_provider import TranscriptionProvider
 from src.config.settings import settings
+from src.infrastructure.ai._http import get_shared_client
 
 class OpenAITranscriptionProvider(TranscriptionProvider):
     """
@@ -12,18 +15,19 @@ class OpenAITranscriptionProvider(TranscriptionProvider):
         self.api_key = settings.OPENAI_API_KEY
         if not self.api_key:
              print("⚠️ OPENAI_API_KEY not found.")
-        self.client = openai.AsyncOpenAI(api_key=self.api_key)
+        self.client = openai.AsyncOpenAI(api_key=self.api_key, http_client=get_shared_client())
         self.model = "whisper-1"
 
     async def transcribe(self, file_path: str, language: str = "fa") -> str:
         print(f"🎙️ OpenAI Transcription ({self.model})...")
         try:
-            with open(file_path, "rb") as file:
-                transcription = await self.client.audio.transcriptions.create(
-                    file=file,
-                    model=self.model,
-                    language=language
-                )
+            # Read in a worker thread so the event loop isn't blocked by disk I/O
+            content = await asyncio.to_thread(Path(file_path).read_bytes)
+            transcription = await self.client.audio.transcriptions.create(
+                file=(os.path.basename(file_path), content),
+                model=self.model,
+                language=language
+            )
             return transcription.text
         except Exception as e:
             print(f"❌ OpenAI Transcription Failed: {e}")
@@ -1,29 +1,45 @@
-import json
+import asyncio
+import functools
+import os
 import openai
-from openai import OpenAI
+from pathlib import Path
+from urllib.parse import quote_plus
+from openai import AsyncOpenAI
 from src.config.settings import settings
+from src.infrastructure.ai import _json
+from src.infrastructure.ai._http import get_shared_client
+from src.infrastructure.ai._prompts import CASE_ANALYSIS_STRUCTURED_PROMPT
+from src.infrastructure.ai.schemas import CaseAnalysis
+from src.infrastructure.ai._retry import retry_on_failure
 
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
+PUBMED_SEARCH_URL = "https://pubmed.ncbi.nlm.nih.gov/?term="
+
+@functools.lru_cache(maxsize=None)
+def get_client() -> AsyncOpenAI:
+    """Process-wide AsyncOpenAI client on the shared HTTP pool; rebuilt after close_all()."""
+    return AsyncOpenAI(api_key=settings.OPENAI_API_KEY, http_client=get_shared_client())
 
 async def transcribe_file(audio_path: str):
     """
     Transcribe audio using OpenAI Whisper-1.
     """
     print("🎙️ OpenAI Transcription...")
-    with open(audio_path, "rb") as audio_file:
-        try:
-            # Try GPT-4o-audio-preview or similar if available, but standard is whisper-1
-            # For fallback, whisper-1 is standard.
-            transcription = client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                response_format="text"
-            )
-            return transcription
-        except Exception as e:
-            print(f"❌ OpenAI Transcription Failed: {e}")
-            raise e
+    # Read in a worker thread so the event loop isn't blocked by disk I/O
+    audio_content = await asyncio.to_thread(Path(audio_path).read_bytes)
+    try:
+        # Try GPT-4o-audio-preview or similar if available, but standard is whisper-1
+        # For fallback, whisper-1 is standard.
+        transcription = await get_client().audio.transcriptions.create(
+            model="whisper-1",
+            file=(os.path.basename(audio_path), audio_content),
+            response_format="text"
+        )
+        return transcription
+    except Exception as e:
+        print(f"❌ OpenAI Transcription Failed: {e}")
+        raise e
 
+@retry_on_failure
 async def generate_clinical_analysis(text: str):
     """
     Generate clinical analysis (Diff Dx, Keywords, Nelson Context) using GPT-4o.
@@ -37,7 +53,7 @@ async def generate_clinical_analysis(text: str):
     """
 
     try:
-        response = client.chat.completions.create(
+        response = await get_client().chat.completions.create(
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -47,41 +63,37 @@ async def generate_clinical_analysis(text: str):
         )
 
         analysis_content = response.choices[0].message.content
-        return json.loads(analysis_content)
+        return _json.loads(analysis_content)
     except Exception as e:
         print(f"❌ GPT-4o Analysis Failed: {e}")
         raise e
 
+@retry_on_failure
 async def summarize_text(text: str):
     """
     Summarize text using GPT-4o.
     """
     print("📋 OpenAI Summarization...")
-    system_prompt = """You are a pediatric expert assistant. Analyze the following morning report case transcript. 
-    Return a JSON object with:
-    - title: string (A suitable title for the case)
-    - transcript: string (The original transcript)
-    - summary: object { chiefComplaint: string, history: string, vitals: string }
-    - differentialDiagnosis: string[] (List of 5 potential diagnoses)
-    - keywords: string[] (List of search terms)
-    - nelsonContext: string (Summary of the condition from Nelson Textbook of Pediatrics context)
-    """
 
-    response = client.chat.completions.create(
+    response = await get_client().chat.completions.parse(
         model="gpt-4o",
         messages=[
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": CASE_ANALYSIS_STRUCTURED_PROMPT},
             {"role": "user", "content": text}
         ],
-        response_format={ "type": "json_object" }
+        response_format=CaseAnalysis
     )
 
-    analysis_content = response.choices[0].message.content
-    analysis = json.loads(analysis_content)
-    
-    if not analysis.get("transcript"):
-        analysis["transcript"] = text
-        
+    message = response.choices[0].message
+    if message.refusal:
+        raise ValueError(f"OpenAI refused the case analysis: {message.refusal}")
+    if message.parsed is None:
+        raise ValueError(
+            f"OpenAI returned no parsed case analysis (finish_reason={response.choices[0].finish_reason})"
+        )
+
+    analysis = message.parsed.model_dump()
+    analysis["transcript"] = text
     return analysis
 
 async def analyze_audio_case(audio_path: str, mime_type: str = "audio/mp3"):
@@ -98,7 +110,7 @@ async def find_pubmed_articles(keywords: list[str]):
     return [
         {
             "title": f"Search PubMed for {kw}",
-            "url": f"https://pubmed.ncbi.nlm.nih.gov/?term={kw.replace(' ', '+')}",
+            "url": PUBMED_SEARCH_URL + quote_plus(kw),
             "snippet": "Click to view search results on PubMed"
         }
         for kw in keywords[:5]
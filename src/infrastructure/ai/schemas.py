@@ -0,0 +1,20 @@
+from typing import List
+from pydantic import BaseModel
+
+
+class CaseSummary(BaseModel):
+    chiefComplaint: str
+    history: str
+    vitals: str
+
+
+class CaseAnalysis(BaseModel):
+    """
+    Structured output of the case analysis prompt.
+    Passed as response_format so the provider enforces the schema itself.
+    """
+    title: str
+    summary: CaseSummary
+    differentialDiagnosis: List[str]
+    keywords: List[str]
+    nelsonContext: str
@@ -2,8 +2,7 @@ import webrtcvad
 import logging
 # audioop is deprecated/removed in Python 3.13, using numpy as replacement
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor
-import asyncio
+from typing import List
 
 class VADService:
     def __init__(self, aggressiveness: int = 2, sample_rate: int = 16000):
@@ -15,29 +14,51 @@ class VADService:
         self.logger = logging.getLogger(__name__)
         # Energy threshold for quick rejection (RMS)
         self.energy_threshold = 300 
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        # rms < t  <=>  sum(x^2) < t^2 * n, which avoids the float upcast and sqrt
+        self._energy_sq_threshold = self.energy_threshold * self.energy_threshold
 
     async def is_speech(self, frame_bytes: bytes) -> bool:
         """
         Checks if the given frame contains speech.
         Uses Hybrid Approach: Energy Check -> WebRTC VAD
-        Offloads CPU-intensive VAD to thread pool.
+        WebRTC VAD takes microseconds per frame, far less than a thread-pool
+        hand-off, so it runs inline.
         """
-        # 1. Fast Energy Check (Main Thread)
+        return self._check_frame(frame_bytes)
+
+    def is_speech_batch(self, frames: List[bytes]) -> List[bool]:
+        """
+        Same decision as is_speech for many equally sized frames at once.
+        The energy gate runs vectorized over all frames; WebRTC VAD is only
+        consulted for frames loud enough to pass it.
+        """
+        if not frames:
+            return []
+        frame_len = len(frames[0])
+        if not frame_len or frame_len % 2 or any(len(frame) != frame_len for frame in frames):
+            # Ragged input can't be viewed as one matrix; check frame by frame
+            return [self._check_frame(frame) for frame in frames]
+
+        samples = np.frombuffer(b"".join(frames), dtype=np.int16).reshape(len(frames), -1).astype(np.int64)
+        sum_sq = np.einsum("ij,ij->i", samples, samples)
+        loud = sum_sq >= self._energy_sq_threshold * samples.shape[1]
+        return [bool(is_loud) and self._vad_check(frame) for frame, is_loud in zip(frames, loud)]
+
+    def _check_frame(self, frame_bytes: bytes) -> bool:
+        # 1. Fast Energy Check
         try:
-            # Calculate RMS using numpy instead of audioop
-            # Convert bytes to int16 array
-            audio_data = np.frombuffer(frame_bytes, dtype=np.int16)
-            rms = np.sqrt(np.mean(audio_data.astype(np.float64)**2))
+            # Compare energy using numpy instead of audioop
+            # Convert bytes to int16 array; int64 so the sum of squares can't overflow
+            audio_data = np.frombuffer(frame_bytes, dtype=np.int16).astype(np.int64)
+            sum_sq = int(audio_data @ audio_data)
             
-            if rms < self.energy_threshold:
+            if sum_sq < self._energy_sq_threshold * audio_data.size:
                 return False
         except Exception:
             pass # Fallback to VAD if rms fails
 
-        # 2. WebRTC VAD (Thread Pool)
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self._vad_check, frame_bytes)
+        # 2. WebRTC VAD
+        return self._vad_check(frame_bytes)
 
     def _vad_check(self, frame_bytes: bytes) -> bool:
         try:
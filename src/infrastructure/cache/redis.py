@@ -1,40 +1,56 @@
-import redis
-import json
+import redis.asyncio as aioredis
 import logging
 from typing import Optional, Any
 from src.config.settings import settings
+from src.infrastructure.ai import _json
 
 logger = logging.getLogger(__name__)
 
+
 class CacheService:
     def __init__(self):
         self.redis_client = None
         try:
-            self.redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
-            # Fail fast check
-            self.redis_client.ping()
+            # Bounded pool shared by every caller of the global `cache` instance.
+            # Values are stored as raw JSON bytes, so no response decoding is needed.
+            self.redis_client = aioredis.from_url(settings.REDIS_URL, decode_responses=False, max_connections=50)
+        except Exception as e:
+            logger.warning(f"Redis client setup failed: {e}. Caching disabled.")
+            self.redis_client = None
+
+    async def connect(self) -> None:
+        """Fail fast check, run at startup: disables caching if Redis is unreachable."""
+        if not self.redis_client:
+            return
+        try:
+            await self.redis_client.ping()
             logger.info("Connected to Redis")
         except Exception as e:
             logger.warning(f"Redis connection failed: {e}. Caching disabled.")
-            self.redis_client = None
+            await self.close()
+
+    async def close(self) -> None:
+        if self.redis_client:
+            client, self.redis_client = self.redis_client, None
+            await client.aclose()
 
-    def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: str) -> Optional[Any]:
         if not self.redis_client:
             return None
         try:
-            data = self.redis_client.get(key)
+            data = await self.redis_client.get(key)
             if data:
-                return json.loads(data)
+                return _json.loads(data)
             return None
         except Exception as e:
             logger.error(f"Redis get error: {e}")
             return None
 
-    def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
+    async def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         if not self.redis_client:
             return False
         try:
-            self.redis_client.setex(key, ttl, json.dumps(value))
+            await self.redis_client.setex(key, ttl, _json.dumps(value))
             return True
         except Exception as e:
             logger.error(f"Redis set error: {e}")
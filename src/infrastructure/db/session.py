@@ -1,4 +1,7 @@
-from sqlalchemy import create_engine
+import contextlib
+import os
+import tempfile
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from src.config.settings import settings
@@ -8,8 +11,9 @@ engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
     pool_pre_ping=True,  # Check connection health
-    pool_size=10,
-    max_overflow=20
+    pool_size=20,
+    max_overflow=40,
+    pool_recycle=1800  # Reopen connections before proxies/LBs drop idle TCP sessions
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -23,33 +27,72 @@ def get_db() -> Session:
     finally:
         db.close()
 
+# Arbitrary application-wide key for the Postgres advisory lock guarding seeding
+_SEED_LOCK_KEY = 42
+
+@contextlib.contextmanager
+def _seed_lock():
+    """
+    Serializes seeding across workers: a Postgres advisory lock, or an
+    exclusive file lock for SQLite/other backends.
+    """
+    if engine.dialect.name == "postgresql":
+        with engine.connect() as conn:
+            conn.execute(text("SELECT pg_advisory_lock(:k)"), {"k": _SEED_LOCK_KEY})
+            try:
+                yield
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": _SEED_LOCK_KEY})
+        return
+
+    try:
+        import fcntl
+    except ImportError:  # Windows: no flock, seeding stays best-effort
+        yield
+        return
+    lock_path = os.path.join(tempfile.gettempdir(), "mac_init_db.lock")
+    with open(lock_path, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
 def init_db():
-    """Create tables in database"""
+    """
+    Create missing tables and the default user.
+    Blocking; call it via asyncio.to_thread from async code.
+    """
     # Import all models to ensure they are registered with Base
     from src.core.domain import user, case, task
-    Base.metadata.create_all(bind=engine)
-    
-    # Create default user
+
     from src.core.domain.user import User
     from src.core.security import get_password_hash
-    
-    db = SessionLocal()
-    try:
-        existing_user = db.query(User).filter(User.email == "admin@example.com").first()
-        if not existing_user:
-            new_user = User(
-                email="admin@example.com",
-                hashed_password=get_password_hash("password123"),
-                full_name="Admin User",
-                role="admin",
-                is_active=True
-            )
-            db.add(new_user)
-            db.commit()
-            print("✅ Default user created: admin@example.com / password123")
-    except Exception as e:
-        print(f"⚠️ Error creating default user: {e}")
-    finally:
-        db.close()
 
-    print("✅ Database tables created successfully")
+    # Serialize DDL and seeding so concurrent workers don't race on create_all
+    with _seed_lock():
+        # Skip DDL entirely when the schema is already in place
+        existing_tables = set(inspect(engine).get_table_names())
+        if not set(Base.metadata.tables).issubset(existing_tables):
+            Base.metadata.create_all(bind=engine)
+            print("✅ Database tables created successfully")
+
+        # Create default user
+        db = SessionLocal()
+        try:
+            existing_user = db.query(User).filter(User.email == "admin@example.com").first()
+            if not existing_user:
+                new_user = User(
+                    email="admin@example.com",
+                    hashed_password=get_password_hash("password123"),
+                    full_name="Admin User",
+                    role="admin",
+                    is_active=True
+                )
+                db.add(new_user)
+                db.commit()
+                print("✅ Default user created: admin@example.com / password123")
+        except Exception as e:
+            print(f"⚠️ Error creating default user: {e}")
+        finally:
+            db.close()
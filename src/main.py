@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
@@ -6,6 +7,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from src.api.api import api_router
 from src.config.settings import settings
 from src.infrastructure.db.session import init_db
+from src.infrastructure.ai.factory import close_all as close_ai_clients
+from src.infrastructure.cache.redis import cache
 from app.routers import summarize, differential, nelson, pubmed, pediatric
 
 # Setup logging
@@ -39,8 +42,15 @@ app.add_middleware(
 )
 
 @app.on_event("startup")
-def on_startup():
-    init_db()
+async def on_startup():
+    # Schema check and seeding hit the DB synchronously; keep them off the event loop
+    await asyncio.to_thread(init_db)
+    await cache.connect()
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await close_ai_clients()
+    await cache.close()
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 app.include_router(summarize.router)
@@ -1,69 +1,282 @@
-import json
+import asyncio
+import contextlib
+import hashlib
 import logging
-import math
-from typing import AsyncGenerator, Dict, List, Any
+import os
+import re
+import tempfile
+import time
+from typing import AsyncGenerator, Dict, Iterator, List, Any, Optional
 import av
 import io
-from src.infrastructure.ai.groq_service import GroqService
+import numpy as np
+from src.config.settings import settings
+from src.infrastructure.ai import _json
+from src.infrastructure.ai.groq_service import get_groq_service
+from src.infrastructure.ai.vad_service import VADService
+from src.infrastructure.cache.redis import cache
+from src.services.local_agreement import LocalAgreement, Word
 
 logger = logging.getLogger(__name__)
 
+BYTES_PER_SECOND = 16000 * 2  # 16k rate * 2 bytes (16-bit)
+LLM_CACHE_TTL = 24 * 3600  # seconds
+# Silence gate: whole-buffer RMS below 300 (same threshold as VADService), or
+# fewer than 5% voiced 30 ms frames, means there is nothing worth transcribing
+SILENCE_SQ_THRESHOLD = 300 * 300
+VAD_FRAME_BYTES = 480 * 2  # 30 ms at 16 kHz
+MIN_VOICED_FRACTION = 0.05
+# Outermost {...} span, for model replies that wrap the JSON object in prose
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Prompts are built once; the constant system message keeps the prompt prefix
+# stable across chunks, which Groq's prompt caching can then reuse.
+_CHUNK_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are an expert clinical and NLP analyst. "
+        "Process the provided audio transcript chunk. "
+        "Output valid JSON only."
+    ),
+}
+
+_CHUNK_USER_TEMPLATE = """Analyze the following transcript chunk (Time: %s to %s):
+"%s"
+
+Provide:
+1. A concise summary preserving clinical/technical details.
+2. Structured analysis including findings, reasoning chain, and keywords.
+
+Format as JSON:
+{
+    "summary": "...",
+    "analysis": {
+        "findings": "...",
+        "reasoning": "...",
+        "keywords": ["...", "..."]
+    }
+}"""
+
+# Response schemas for Groq structured outputs, built once
+_CHUNK_ANALYSIS_SCHEMA = {
+    "name": "chunk_analysis",
+    "schema": {
+        "type": "object",
+        "properties": {
+            "summary": {"type": "string"},
+            "analysis": {
+                "type": "object",
+                "properties": {
+                    "findings": {"type": "string"},
+                    "reasoning": {"type": "string"},
+                    "keywords": {"type": "array", "items": {"type": "string"}}
+                },
+                "required": ["findings", "reasoning", "keywords"],
+                "additionalProperties": False
+            }
+        },
+        "required": ["summary", "analysis"],
+        "additionalProperties": False
+    }
+}
+
+_FINAL_REPORT_SCHEMA = {
+    "name": "final_report",
+    "schema": {
+        "type": "object",
+        "properties": {
+            "full_summary": {"type": "string"},
+            "insight_highlights": {"type": "string"}
+        },
+        "required": ["full_summary", "insight_highlights"],
+        "additionalProperties": False
+    }
+}
+
+_FINAL_REPORT_SYSTEM_MESSAGE = {"role": "system", "content": "You are an expert creating a final clinical report."}
+
+_FINAL_REPORT_USER_TEMPLATE = """Based on the following chunk summaries and full transcript, generate a Final Report.
+
+Full Transcript:
+%s
+
+Chunk Summaries:
+%s
+
+Return JSON:
+{
+    "full_summary": "Global coherent summary...",
+    "insight_highlights": "Key analytical/clinical insights..."
+}"""
+
+def _parse_json_object(text: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Parses a JSON object reply, recovering one embedded in surrounding text; None if there is none."""
+    if not text:
+        return None
+    try:
+        return _json.loads(text)
+    except ValueError:
+        match = _JSON_OBJECT_RE.search(text)
+        if not match:
+            return None
+        try:
+            return _json.loads(match.group(0))
+        except ValueError:
+            return None
+
 class GroqPipelineService:
     def __init__(self):
-        self.groq_service = GroqService()
-        self.chunk_duration = 30  # seconds
+        self.groq_service = get_groq_service()
+        self.vad_service = VADService()
+        self.chunk_duration = 30  # seconds of transcript per summarized chunk
+        # Streaming transcription (LocalAgreement-2): new audio per pass and the rolling buffer cap
+        self.step_duration = settings.STREAM_STEP_SECONDS
+        self.max_buffer_duration = settings.STREAM_MAX_BUFFER_SECONDS
 
     def _format_time(self, seconds: float) -> str:
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        s = int(seconds % 60)
-        return f"{h:02d}:{m:02d}:{s:02d}"
+        s = int(seconds)
+        return "%02d:%02d:%02d" % (s // 3600, s % 3600 // 60, s % 60)
+
+    @staticmethod
+    def _pcm_cache_path(file_path: str) -> str:
+        """Location of the decoded 16 kHz s16le mono PCM for this file's content."""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return os.path.join(settings.PCM_CACHE_DIR, f"{digest.hexdigest()}.s16le")
+
+    @staticmethod
+    def _decoded_pcm(file_path: str, cache_path: Optional[str] = None) -> Iterator[memoryview]:
+        """
+        Decodes and resamples the file, yielding raw PCM per frame. With a
+        `cache_path`, the PCM is also written there; the entry only appears
+        once decoding completes.
+        """
+        out = None
+        tmp_path = None
+        if cache_path:
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            # Unique per writer, so concurrent decodes of the same upload can't interleave
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            out = os.fdopen(fd, "wb")
+        try:
+            with av.open(file_path) as container:
+                stream = container.streams.audio[0]
+                resampler = av.AudioResampler(format='s16', layout='mono', rate=16000)
+                for frame in container.decode(stream):
+                    frame.pts = None
+                    for r_frame in resampler.resample(frame):
+                        # Packed s16 mono: the samples are the start of plane 0 (the rest is padding)
+                        pcm = memoryview(r_frame.planes[0])[:r_frame.samples * 2]
+                        if out is not None:
+                            out.write(pcm)
+                        yield pcm
+        except BaseException:
+            if out is not None:
+                # Failed or abandoned part-way: never leave a truncated cache entry
+                out.close()
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+            raise
+        if out is not None:
+            out.close()
+            os.replace(tmp_path, cache_path)
+            GroqPipelineService._evict_pcm_cache(os.path.dirname(cache_path))
 
-    async def _chunk_audio_generator(self, file_path: str) -> AsyncGenerator[Dict[str, Any], None]:
+    @staticmethod
+    def _evict_pcm_cache(cache_dir: str) -> None:
+        """Drops entries past PCM_CACHE_TTL, then least recently used ones until under PCM_CACHE_MAX_BYTES."""
+        now = time.time()
+        entries = []
+        for entry in os.scandir(cache_dir):
+            if not entry.name.endswith(".s16le"):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            if now - stat.st_mtime > settings.PCM_CACHE_TTL:
+                with contextlib.suppress(OSError):
+                    os.remove(entry.path)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= settings.PCM_CACHE_MAX_BYTES:
+                break
+            with contextlib.suppress(OSError):
+                os.remove(path)
+            total -= size
+
+    @staticmethod
+    def _cached_pcm(cache_path: str, block_size: int) -> Iterator[bytes]:
+        with open(cache_path, "rb") as f:
+            yield from iter(lambda: f.read(block_size), b"")
+
+    async def _chunk_audio_generator(self, file_path: str, chunk_duration: Optional[int] = None) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Yields chunks of audio as raw PCM bytes (16kHz, mono, s16le).
+        With PCM_CACHE_DIR set, decoded PCM is cached on disk by file hash, so
+        reprocessing the same upload skips demuxing and resampling entirely.
         """
+        chunk_duration = chunk_duration or self.chunk_duration
         try:
-            container = av.open(file_path)
-            stream = container.streams.audio[0]
-            resampler = av.AudioResampler(format='s16', layout='mono', rate=16000)
+            bytes_per_second = BYTES_PER_SECOND
+            chunk_size = bytes_per_second * chunk_duration
 
-            bytes_per_second = 16000 * 2  # 16k rate * 2 bytes (16-bit)
-            chunk_size = bytes_per_second * self.chunk_duration
+            cache_path = None
+            if settings.PCM_CACHE_DIR:
+                cache_path = await asyncio.to_thread(self._pcm_cache_path, file_path)
+            if cache_path and os.path.exists(cache_path):
+                # Refresh the mtime so eviction treats it as recently used
+                with contextlib.suppress(OSError):
+                    os.utime(cache_path)
+                source = self._cached_pcm(cache_path, chunk_size)
+            else:
+                source = self._decoded_pcm(file_path, cache_path)
             
-            current_chunk_data = bytearray()
+            # Fixed chunk buffer filled in place; no per-chunk reallocation of the remainder
+            chunk_buffer = bytearray(chunk_size)
+            chunk_view = memoryview(chunk_buffer)
+            write_pos = 0
             chunk_index = 0
             
-            for frame in container.decode(stream):
-                frame.pts = None
-                resampled_frames = resampler.resample(frame)
-                
-                for r_frame in resampled_frames:
-                    current_chunk_data.extend(r_frame.to_ndarray().tobytes())
+            for pcm in source:
+                pcm = memoryview(pcm)
+                while pcm:
+                    n = min(len(pcm), chunk_size - write_pos)
+                    chunk_view[write_pos:write_pos + n] = pcm[:n]
+                    write_pos += n
+                    pcm = pcm[n:]
+                    
+                    if write_pos < chunk_size:
+                        break
+                    
+                    start_time = chunk_index * chunk_duration
+                    end_time = start_time + chunk_duration
                     
-                    while len(current_chunk_data) >= chunk_size:
-                        start_time = chunk_index * self.chunk_duration
-                        end_time = start_time + self.chunk_duration
-                        
-                        yield {
-                            "index": chunk_index,
-                            "data": bytes(current_chunk_data[:chunk_size]),
-                            "start_time": start_time,
-                            "end_time": end_time
-                        }
-                        
-                        current_chunk_data = current_chunk_data[chunk_size:]
-                        chunk_index += 1
+                    yield {
+                        "index": chunk_index,
+                        "data": bytes(chunk_buffer),
+                        "start_time": start_time,
+                        "end_time": end_time
+                    }
+                    
+                    write_pos = 0
+                    chunk_index += 1
             
-            if current_chunk_data:
-                start_time = chunk_index * self.chunk_duration
+            if write_pos:
+                start_time = chunk_index * chunk_duration
                 # Estimate end time based on remaining bytes
-                duration = len(current_chunk_data) / bytes_per_second
+                duration = write_pos / bytes_per_second
                 end_time = start_time + duration
                 
                 yield {
                     "index": chunk_index,
-                    "data": bytes(current_chunk_data),
+                    "data": bytes(chunk_view[:write_pos]),
                     "start_time": start_time,
                     "end_time": end_time
                 }
@@ -72,124 +285,249 @@ class GroqPipelineService:
             logger.error(f"Error chunking audio: {e}")
             raise
 
-    async def process_stream(self, file_path: str) -> AsyncGenerator[str, None]:
+    def _is_silent(self, pcm: bytes) -> bool:
         """
-        Processes audio file in chunks and yields JSON results stringified.
+        Cheap local check that a 16 kHz s16 mono buffer has no speech,
+        so it can be skipped without a transcription request.
         """
-        accumulated_transcript = ""
-        accumulated_summaries = []
-        
-        chunk_gen = self._chunk_audio_generator(file_path)
-        
-        async for chunk in chunk_gen:
-            chunk_idx = chunk["index"]
-            start_str = self._format_time(chunk["start_time"])
-            end_str = self._format_time(chunk["end_time"])
-            audio_data = chunk["data"]
-            
-            # 1. Transcribe
-            # Add some context from previous transcript if needed (Whisper prompt limits apply)
-            prompt = accumulated_transcript[-200:] if accumulated_transcript else ""
-            transcript = await self.groq_service.transcribe(audio_data, prompt=prompt)
-            
-            if not transcript:
-                transcript = "[Unintelligible]"
-            
-            accumulated_transcript += " " + transcript
-            
-            # 2. Summarize & Analyze
-            # We do this in one LLM call to save time and tokens, or two if better.
-            # User asked for "Summarization" then "Analytical Reasoning". 
-            # Can be combined in one prompt requesting JSON output.
-            
-            system_prompt = (
-                "You are an expert clinical and NLP analyst. "
-                "Process the provided audio transcript chunk. "
-                "Output valid JSON only."
-            )
-            
-            user_prompt = f"""
-            Analyze the following transcript chunk (Time: {start_str} to {end_str}):
-            "{transcript}"
-            
-            Provide:
-            1. A concise summary preserving clinical/technical details.
-            2. Structured analysis including findings, reasoning chain, and keywords.
-            
-            Format as JSON:
-            {{
-                "summary": "...",
-                "analysis": {{
-                    "findings": "...",
-                    "reasoning": "...",
-                    "keywords": ["...", "..."]
-                }}
-            }}
-            """
-            
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ]
-            
-            llm_response_str = await self.groq_service.chat(messages, json_mode=True)
-            
-            try:
-                llm_data = json.loads(llm_response_str)
-            except (json.JSONDecodeError, TypeError):
-                llm_data = {
-                    "summary": "Analysis failed",
-                    "analysis": {
-                        "findings": "N/A",
-                        "reasoning": "N/A",
-                        "keywords": []
-                    }
+        samples = np.frombuffer(pcm, dtype=np.int16, count=len(pcm) // 2).astype(np.int64)
+        if not samples.size:
+            return True
+        if samples @ samples < SILENCE_SQ_THRESHOLD * samples.size:
+            return True
+
+        usable = len(pcm) - len(pcm) % VAD_FRAME_BYTES
+        frames = [pcm[i:i + VAD_FRAME_BYTES] for i in range(0, usable, VAD_FRAME_BYTES)]
+        if not frames:
+            return False
+        voiced = sum(self.vad_service.is_speech_batch(frames))
+        return voiced < MIN_VOICED_FRACTION * len(frames)
+
+    @staticmethod
+    def _trim_buffer(buffer: bytearray, buffer_start: float, until: float) -> float:
+        """Drops buffered audio before `until` (absolute seconds); returns the new buffer start."""
+        cut = min(max(int((until - buffer_start) * 16000) * 2, 0), len(buffer))
+        del buffer[:cut]
+        return buffer_start + cut / BYTES_PER_SECOND
+
+    async def _committed_words(self, file_path: str) -> AsyncGenerator[List[Word], None]:
+        """
+        Transcribes the file with a rolling buffer and the LocalAgreement-2 policy.
+        Every `step_duration` seconds of new audio, the whole buffer is re-transcribed;
+        words confirmed by two consecutive passes are committed (yielded) and the
+        audio they cover is trimmed from the buffer, so sentences are never cut at
+        a fixed chunk boundary and the buffer stays bounded.
+        """
+        agreement = LocalAgreement()
+        buffer = bytearray()
+        buffer_start = 0.0
+        max_bytes = self.max_buffer_duration * BYTES_PER_SECOND
+        context = ""
+
+        async for chunk in self._chunk_audio_generator(file_path, self.step_duration):
+            buffer += chunk["data"]
+
+            if len(buffer) > max_bytes:
+                # No agreement within the buffer cap: accept the pending words as they are
+                forced = agreement.flush()
+                if forced:
+                    context = (context + " " + " ".join(w["word"] for w in forced))[-200:]
+                    yield forced
+                buffer_start = self._trim_buffer(buffer, buffer_start, agreement.committed_end)
+                if len(buffer) > max_bytes:
+                    buffer_start = self._trim_buffer(buffer, buffer_start, buffer_start + (len(buffer) - max_bytes) / BYTES_PER_SECOND)
+
+            # Only the new step needs a speech check: with no pending words there is
+            # nothing earlier left to confirm. The buffer cap above trims the silence.
+            if not agreement.has_pending and await asyncio.to_thread(self._is_silent, chunk["data"]):
+                continue
+
+            audio = bytes(buffer)
+
+            # Whisper prompt carries the last committed text as context
+            words = await self.groq_service.transcribe_words(audio, prompt=context)
+            committed = agreement.insert(words, buffer_start)
+            if committed:
+                context = (context + " " + " ".join(w["word"] for w in committed))[-200:]
+                yield committed
+                buffer_start = self._trim_buffer(buffer, buffer_start, agreement.committed_end)
+
+        tail = agreement.flush()
+        if tail:
+            yield tail
+
+    def _chunk_messages(self, start_str: str, end_str: str, transcript: str) -> List[Dict[str, str]]:
+        """Builds the summary/analysis chat request for one transcript chunk."""
+        # Summary and analysis come from a single structured-output call per chunk
+        return [_CHUNK_SYSTEM_MESSAGE, {"role": "user", "content": _CHUNK_USER_TEMPLATE % (start_str, end_str, transcript)}]
+
+    def _chunk_result(self, chunk_idx: int, start_str: str, end_str: str, transcript: str, llm_response_str: Optional[str]) -> Dict[str, Any]:
+        llm_data = _parse_json_object(llm_response_str)
+        if not isinstance(llm_data, dict):
+            # Only reachable if the model ignored the schema or the call returned nothing
+            llm_data = {
+                "summary": "Analysis failed",
+                "analysis": {
+                    "findings": "N/A",
+                    "reasoning": "N/A",
+                    "keywords": []
                 }
-            
-            result = {
-                "chunk_index": chunk_idx,
-                "start_time": start_str,
-                "end_time": end_str,
-                "transcript": transcript,
-                "summary": llm_data.get("summary", ""),
-                "analysis": llm_data.get("analysis", {})
             }
-            
-            accumulated_summaries.append(result["summary"])
-            
-            yield json.dumps(result) + "\n"
-        
-        # Final Report
-        final_report_prompt = f"""
-        Based on the following chunk summaries and full transcript, generate a Final Report.
-        
-        Full Transcript:
-        {accumulated_transcript}
         
-        Chunk Summaries:
-        {" ".join(accumulated_summaries)}
-        
-        Return JSON:
-        {{
-            "full_summary": "Global coherent summary...",
-            "insight_highlights": "Key analytical/clinical insights..."
-        }}
+        return {
+            "chunk_index": chunk_idx,
+            "start_time": start_str,
+            "end_time": end_str,
+            "transcript": transcript,
+            "summary": llm_data.get("summary", ""),
+            "analysis": llm_data.get("analysis", {})
+        }
+
+    async def _analyze_chunk(self, chunk_idx: int, start_time: float, end_time: float, transcript: str) -> Dict[str, Any]:
+        """Summarizes and analyzes one chunk of committed transcript."""
+        start_str = self._format_time(start_time)
+        end_str = self._format_time(end_time)
+        messages = self._chunk_messages(start_str, end_str, transcript)
+        llm_response_str = await self._cached_chat(messages)
+        return self._chunk_result(chunk_idx, start_str, end_str, transcript, llm_response_str)
+
+    @staticmethod
+    def _llm_cache_key(messages: List[Dict[str, str]]) -> str:
+        payload = "\0".join([settings.GROQ_MODEL] + [m["content"] for m in messages])
+        return f"llm:{hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()}"
+
+    async def _cached_chat(self, messages: List[Dict[str, str]]) -> Optional[str]:
         """
-        
+        Structured chat call memoized in Redis by a hash of the prompts,
+        so re-processing the same audio skips the repeated LLM round-trips.
+        """
+        key = self._llm_cache_key(messages)
+        cached = await cache.get(key)
+        if cached is not None:
+            return cached
+        response = await self.groq_service.chat(messages, json_schema=_CHUNK_ANALYSIS_SCHEMA)
+        if response is not None:
+            await cache.set(key, response, ttl=LLM_CACHE_TTL)
+        return response
+
+    async def _final_report(self, accumulated_transcript: str, accumulated_summaries: List[str]) -> Dict[str, Any]:
         messages = [
-             {"role": "system", "content": "You are an expert creating a final clinical report."},
-             {"role": "user", "content": final_report_prompt}
+            _FINAL_REPORT_SYSTEM_MESSAGE,
+            {"role": "user", "content": _FINAL_REPORT_USER_TEMPLATE % (accumulated_transcript, " ".join(accumulated_summaries))}
         ]
         
-        final_resp_str = await self.groq_service.chat(messages, json_mode=True)
+        final_resp_str = await self.groq_service.chat(messages, json_schema=_FINAL_REPORT_SCHEMA)
+        final_data = _parse_json_object(final_resp_str)
+        if not isinstance(final_data, dict):
+            return {"full_summary": "Error generating report", "insight_highlights": "N/A"}
+        return final_data
+
+    async def process_stream(self, file_path: str) -> AsyncGenerator[str, None]:
+        """
+        Processes audio file in chunks and yields JSON results stringified.
+        A chunk result is emitted once about `chunk_duration` seconds of
+        transcript have been committed.
+
+        Transcription has to run in order, but chunk analyses don't: each one is
+        started as soon as its transcript is committed (up to GROQ_CONCURRENCY at
+        once) while transcription carries on, and results are yielded in order.
+        """
+        accumulated_transcript = ""
+        accumulated_summaries = []
+        limiter = asyncio.Semaphore(settings.GROQ_CONCURRENCY)
+        # Analysis tasks in chunk order; None marks the end of the stream
+        analyses: asyncio.Queue = asyncio.Queue()
+
+        async def analyze(chunk_idx: int, start_time: float, end_time: float, transcript: str) -> Dict[str, Any]:
+            async with limiter:
+                return await self._analyze_chunk(chunk_idx, start_time, end_time, transcript)
+
+        async def produce() -> None:
+            nonlocal accumulated_transcript
+            chunk_idx = 0
+            chunk_start = 0.0
+            chunk_words: List[Word] = []
+
+            def submit() -> None:
+                # 1. Transcript for this chunk (already committed by LocalAgreement)
+                transcript = " ".join(w["word"] for w in chunk_words)
+                analyses.put_nowait(asyncio.create_task(analyze(chunk_idx, chunk_start, chunk_words[-1]["end"], transcript)))
+
+            try:
+                async for words in self._committed_words(file_path):
+                    chunk_words.extend(words)
+                    accumulated_transcript += " " + " ".join(w["word"] for w in words)
+                    if chunk_words[-1]["end"] - chunk_start < self.chunk_duration:
+                        continue
+
+                    submit()
+                    chunk_idx += 1
+                    chunk_start = chunk_words[-1]["end"]
+                    chunk_words = []
+
+                if chunk_words:
+                    submit()
+            finally:
+                analyses.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
         try:
-            final_data = json.loads(final_resp_str)
-        except:
-             final_data = {"full_summary": "Error generating report", "insight_highlights": "N/A"}
-             
+            while (task := await analyses.get()) is not None:
+                result = await task
+                accumulated_summaries.append(result["summary"])
+                yield _json.dumps(result) + "\n"
+            # Surface transcription errors
+            await producer
+        finally:
+            producer.cancel()
+            while not analyses.empty():
+                task = analyses.get_nowait()
+                if task is not None:
+                    task.cancel()
+        
+        # Final Report
+        final_data = await self._final_report(accumulated_transcript, accumulated_summaries)
+
         final_output = {
             "type": "final_report",
             "data": final_data
         }
         
-        yield json.dumps(final_output) + "\n"
+        yield _json.dumps(final_output) + "\n"
+
+    async def process_batch(self, file_path: str) -> Dict[str, Any]:
+        """
+        Offline variant of process_stream for when nobody is waiting on the result.
+        Chunks are transcribed in order (each uses the previous text as its prompt),
+        then all chunk analyses go out as one Groq Batch job, which is billed at a
+        discount and not subject to the per-minute rate limits.
+        """
+        chunks = []
+        accumulated_transcript = ""
+
+        async for chunk in self._chunk_audio_generator(file_path):
+            prompt = accumulated_transcript[-200:] if accumulated_transcript else ""
+            transcript = await self.groq_service.transcribe(chunk["data"], prompt=prompt)
+            if not transcript:
+                transcript = "[Unintelligible]"
+            accumulated_transcript += " " + transcript
+            chunks.append((
+                chunk["index"],
+                self._format_time(chunk["start_time"]),
+                self._format_time(chunk["end_time"]),
+                transcript
+            ))
+
+        responses = await self.groq_service.chat_batch(
+            {f"chunk-{idx}": self._chunk_messages(start_str, end_str, transcript) for idx, start_str, end_str, transcript in chunks},
+            json_mode=True
+        )
+        results = [
+            self._chunk_result(idx, start_str, end_str, transcript, responses.get(f"chunk-{idx}"))
+            for idx, start_str, end_str, transcript in chunks
+        ]
+
+        return {
+            "chunks": results,
+            "final_report": await self._final_report(accumulated_transcript, [r["summary"] for r in results])
+        }
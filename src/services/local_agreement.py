@@ -0,0 +1,80 @@
+from typing import Any, Dict, List
+
+Word = Dict[str, Any]
+
+# Longest run of words checked for repeats across the commit boundary
+MAX_OVERLAP_NGRAM = 5
+# Only hypotheses starting this close (s) to the last commit can repeat it
+OVERLAP_WINDOW = 1.0
+
+
+def _normalize(word: str) -> str:
+    return word.strip(" \t\n.,!?;:،؟«»\"'").lower()
+
+
+class LocalAgreement:
+    """
+    LocalAgreement-2 commit policy for streaming transcription.
+
+    Each new hypothesis (the words of the current audio buffer) is compared
+    with the previous one; only their longest common prefix is committed.
+    Words the two disagree on stay pending until a later pass confirms them,
+    so text near the moving edge of the buffer is never emitted half-heard.
+    Words at the start of a hypothesis that repeat the tail of the committed
+    text (re-heard with shifted timestamps) are dropped, as in whisper_streaming.
+    """
+
+    def __init__(self):
+        self.committed_end = 0.0       # absolute time (s) of the last committed word end
+        self._pending: List[Word] = []  # uncommitted tail of the previous hypothesis
+        self._recent: List[Word] = []   # last committed words, for boundary dedup
+
+    def insert(self, words: List[Word], offset: float) -> List[Word]:
+        """
+        Feeds a hypothesis whose timestamps are relative to `offset` seconds
+        and returns the newly committed words, with absolute timestamps.
+        """
+        hypothesis = [
+            {"word": w["word"], "start": w["start"] + offset, "end": w["end"] + offset}
+            for w in words
+            if w["end"] + offset > self.committed_end and _normalize(w["word"])
+        ]
+        self._drop_overlap(hypothesis)
+
+        agreed = 0
+        for new, old in zip(hypothesis, self._pending):
+            if _normalize(new["word"]) != _normalize(old["word"]):
+                break
+            agreed += 1
+
+        committed = hypothesis[:agreed]
+        self._commit(committed)
+        self._pending = hypothesis[agreed:]
+        return committed
+
+    @property
+    def has_pending(self) -> bool:
+        """Whether words from the last hypothesis still await confirmation."""
+        return bool(self._pending)
+
+    def flush(self) -> List[Word]:
+        """Commits whatever is still pending (end of stream, or buffer overflow)."""
+        committed, self._pending = self._pending, []
+        self._commit(committed)
+        return committed
+
+    def _commit(self, words: List[Word]) -> None:
+        if words:
+            self.committed_end = words[-1]["end"]
+            self._recent = (self._recent + words)[-MAX_OVERLAP_NGRAM:]
+
+    def _drop_overlap(self, hypothesis: List[Word]) -> None:
+        """Removes leading words that repeat the last committed n-gram."""
+        if not hypothesis or abs(hypothesis[0]["start"] - self.committed_end) >= OVERLAP_WINDOW:
+            return
+        for n in range(min(len(self._recent), len(hypothesis)), 0, -1):
+            tail = [_normalize(w["word"]) for w in self._recent[-n:]]
+            head = [_normalize(w["word"]) for w in hypothesis[:n]]
+            if tail == head:
+                del hypothesis[:n]
+                return
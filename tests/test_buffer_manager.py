@@ -0,0 +1,81 @@
+import numpy as np
+
+from src.infrastructure.ai.buffer_manager import BufferManager
+
+ONE_SEC = 32000  # 16kHz * 2 bytes
+
+
+def test_buffer_accumulation():
+    manager = BufferManager()
+
+    # Settings: Window=4s, Overlap=1s
+    assert manager.add_audio(b'\x00' * ONE_SEC * 3) is None
+    assert len(manager.buffer) == ONE_SEC * 3
+
+    result = manager.add_audio(b'\x00' * ONE_SEC * 2)
+    assert len(result) == 4 * ONE_SEC  # First window has no overlap prefix
+
+    # Consumed (Window - Overlap) = 3s of the 5s received
+    assert len(manager.buffer) == 2 * ONE_SEC
+
+
+def test_overlap_logic():
+    manager = BufferManager()
+
+    chunk_4s = b'\x01' * 4 * ONE_SEC
+    assert manager.add_audio(chunk_4s) == chunk_4s
+
+    # Remaining 1s of x01 plus 3s of x02 completes the next window
+    res2 = manager.add_audio(b'\x02' * 3 * ONE_SEC)
+    assert len(res2) == ONE_SEC + 4 * ONE_SEC  # Overlap + Window
+    assert res2[:2 * ONE_SEC] == b'\x01' * 2 * ONE_SEC
+    assert res2[2 * ONE_SEC:] == b'\x02' * 3 * ONE_SEC
+
+
+def test_add_audio_np_matches_add_audio():
+    samples = np.arange(5 * ONE_SEC // 2, dtype=np.int16)
+    data = samples.tobytes()
+    by_bytes, by_view = BufferManager(), BufferManager()
+
+    for start in range(0, len(data), 3200):
+        expected = by_bytes.add_audio(data[start:start + 3200])
+        view = by_view.add_audio_np(data[start:start + 3200])
+        if expected is None:
+            assert view is None
+        else:
+            assert view.dtype == np.int16
+            assert view.tobytes() == expected
+
+
+def test_overflow_drops_oldest_audio():
+    manager = BufferManager()
+    manager.window_size = manager.max_buffer_size + 1  # never emit a window
+    max_bytes = manager.max_buffer_size * 2
+
+    manager.add_audio(b'\x01' * max_bytes)
+    manager.add_audio(b'\x02' * ONE_SEC)
+
+    assert len(manager.buffer) == max_bytes
+    assert bytes(manager.buffer[-ONE_SEC:]) == b'\x02' * ONE_SEC
+    assert bytes(manager.buffer[:1]) == b'\x01'
+
+
+def test_odd_length_chunks_stay_sample_aligned():
+    manager = BufferManager()
+    data = np.arange(4 * ONE_SEC // 2, dtype=np.int16).tobytes()
+
+    assert manager.add_audio(data[:1001]) is None
+    assert len(manager.buffer) == 1000  # half-sample deferred
+    result = manager.add_audio(data[1001:])
+
+    assert result == data
+
+
+def test_flush_returns_overlap_and_pending():
+    manager = BufferManager()
+    manager.add_audio(b'\x01' * 4 * ONE_SEC)
+
+    flushed = manager.flush()
+
+    assert len(flushed) == ONE_SEC + ONE_SEC  # overlap + remaining 1s
+    assert manager.flush() is None
@@ -0,0 +1,28 @@
+from src.api.v1.endpoints.cases import extract_chief_complaint
+
+
+def test_labelled_chief_complaint_is_extracted():
+    text = "Patient is a 4yo.\nChief Complaint: fever and cough\nHPI: three days"
+
+    assert extract_chief_complaint(text) == "fever and cough"
+
+
+def test_alternative_labels_match_case_insensitively():
+    assert extract_chief_complaint("PRESENTING COMPLAINT - vomiting") == "vomiting"
+    assert extract_chief_complaint("reason for visit: rash") == "rash"
+
+
+def test_falls_back_to_first_line():
+    assert extract_chief_complaint("  Abdominal pain since morning\nmore text") == "Abdominal pain since morning"
+
+
+def test_long_complaint_is_truncated_on_a_word_boundary():
+    complaint = extract_chief_complaint("Chief complaint: " + "word " * 100)
+
+    assert len(complaint) <= 297
+    assert complaint.endswith("word")
+
+
+def test_empty_text_returns_none():
+    assert extract_chief_complaint(None) is None
+    assert extract_chief_complaint("   ") is None
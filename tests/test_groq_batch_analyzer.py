@@ -0,0 +1,69 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.infrastructure.ai.groq_service import _BatchAnalyzer
+
+
+def _make_service(batch_results=None, batch_error=None):
+    service = MagicMock()
+    service._analyze_single = AsyncMock(side_effect=lambda t: {"title": t})
+    if batch_error:
+        service._analyze_batch = AsyncMock(side_effect=batch_error)
+    else:
+        service._analyze_batch = AsyncMock(return_value=batch_results)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_single_request_uses_single_path():
+    analyzer = _BatchAnalyzer(batch_window=0.01)
+    service = _make_service()
+
+    result = await analyzer.submit(service, "case a")
+
+    assert result == {"title": "case a"}
+    service._analyze_batch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch():
+    analyzer = _BatchAnalyzer(batch_window=0.05)
+    service = _make_service(batch_results={0: {"title": "A"}, 1: {"title": "B"}, 2: {"title": "C"}})
+
+    results = await asyncio.gather(*(analyzer.submit(service, t) for t in ("a", "b", "c")))
+
+    assert results == [{"title": "A"}, {"title": "B"}, {"title": "C"}]
+    service._analyze_batch.assert_awaited_once_with(["a", "b", "c"])
+    service._analyze_single.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_missing_batch_entries_fall_back_to_single_calls():
+    analyzer = _BatchAnalyzer(batch_window=0.05)
+    service = _make_service(batch_results={0: {"title": "A"}})
+
+    results = await asyncio.gather(analyzer.submit(service, "a"), analyzer.submit(service, "b"))
+
+    assert results == [{"title": "A"}, {"title": "b"}]
+    service._analyze_single.assert_awaited_once_with("b")
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_falls_back_to_single_calls():
+    analyzer = _BatchAnalyzer(batch_window=0.05)
+    service = _make_service(batch_error=Exception("bad json"))
+
+    results = await asyncio.gather(analyzer.submit(service, "a"), analyzer.submit(service, "b"))
+
+    assert results == [{"title": "a"}, {"title": "b"}]
+
+
+@pytest.mark.asyncio
+async def test_lone_request_is_dispatched_without_waiting_for_the_window():
+    analyzer = _BatchAnalyzer(batch_window=5.0)
+    service = _make_service()
+
+    result = await asyncio.wait_for(analyzer.submit(service, "a"), timeout=1.0)
+
+    assert result == {"title": "a"}
@@ -0,0 +1,67 @@
+import httpx
+import pytest
+from groq import APIStatusError
+from unittest.mock import AsyncMock
+
+from src.infrastructure.ai.groq_service import GroqService
+
+# Patches GroqService class-level state
+pytestmark = pytest.mark.xdist_group("ai_module_state")
+
+SCHEMA = {"name": "test", "schema": {"type": "object"}}
+
+
+def _status_error(status: int, message: str = "error") -> APIStatusError:
+    request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+    return APIStatusError(message, response=httpx.Response(status, request=request), body=None)
+
+
+@pytest.fixture(autouse=True)
+def reset_support(monkeypatch):
+    monkeypatch.setattr(GroqService, "_json_schema_unsupported", set())
+
+
+@pytest.mark.asyncio
+async def test_schema_is_requested_when_supported():
+    service = GroqService()
+    service._complete = AsyncMock(return_value="{}")
+
+    assert await service.chat([], model="m", json_schema=SCHEMA) == "{}"
+
+    service._complete.assert_awaited_once_with([], "m", {"type": "json_schema", "json_schema": SCHEMA})
+
+
+@pytest.mark.asyncio
+async def test_unsupported_model_falls_back_to_json_mode_once():
+    service = GroqService()
+    service._complete = AsyncMock(
+        side_effect=[_status_error(400, "response_format `json_schema` is not supported with this model"), "{}", "{}"]
+    )
+
+    assert await service.chat([], model="m", json_schema=SCHEMA) == "{}"
+    assert await service.chat([], model="m", json_schema=SCHEMA) == "{}"
+
+    formats = [call.args[2] for call in service._complete.await_args_list]
+    assert formats == [{"type": "json_schema", "json_schema": SCHEMA}, {"type": "json_object"}, {"type": "json_object"}]
+
+
+@pytest.mark.asyncio
+async def test_schema_validation_failure_keeps_model_supported():
+    service = GroqService()
+    service._complete = AsyncMock(side_effect=[_status_error(400, "json_validate_failed"), "{}"])
+
+    assert await service.chat([], model="m", json_schema=SCHEMA) == "{}"
+
+    assert "m" not in GroqService._json_schema_unsupported
+
+
+@pytest.mark.asyncio
+async def test_unrelated_bad_request_is_raised_and_not_cached():
+    service = GroqService()
+    service._complete = AsyncMock(side_effect=_status_error(400, "context_length_exceeded"))
+
+    with pytest.raises(APIStatusError):
+        await service.chat([], model="m", json_schema=SCHEMA)
+
+    assert "m" not in GroqService._json_schema_unsupported
+    service._complete.assert_awaited_once()
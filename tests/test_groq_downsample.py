@@ -0,0 +1,34 @@
+import numpy as np
+
+from src.infrastructure.ai.groq_service import _downsample_pcm
+
+
+def test_mono_16k_passes_through_unchanged():
+    pcm = np.arange(160, dtype=np.int16).tobytes()
+
+    out, rate = _downsample_pcm(pcm, 16000, 1)
+
+    assert out is pcm
+    assert rate == 16000
+
+
+def test_stereo_48k_is_downmixed_and_decimated():
+    left = np.full(4800, 1000, dtype=np.int16)
+    right = np.full(4800, 3000, dtype=np.int16)
+    pcm = np.column_stack([left, right]).tobytes()
+
+    out, rate = _downsample_pcm(pcm, 48000, 2)
+
+    samples = np.frombuffer(out, dtype=np.int16)
+    assert rate == 16000
+    assert samples.size == 1600
+    assert (samples == 2000).all()
+
+
+def test_44k_is_resampled_to_16k():
+    pcm = np.zeros(44100, dtype=np.int16).tobytes()
+
+    out, rate = _downsample_pcm(pcm, 44100, 1)
+
+    assert rate == 16000
+    assert len(out) == 16000 * 2
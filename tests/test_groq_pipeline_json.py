@@ -0,0 +1,17 @@
+from src.services.groq_pipeline_service import _parse_json_object
+
+
+def test_plain_json_object():
+    assert _parse_json_object('{"summary": "ok"}') == {"summary": "ok"}
+
+
+def test_json_object_wrapped_in_prose():
+    reply = 'Here is the analysis:\n```json\n{"summary": "X", "analysis": {"keywords": ["a"]}}\n```\nDone.'
+
+    assert _parse_json_object(reply) == {"summary": "X", "analysis": {"keywords": ["a"]}}
+
+
+def test_unparseable_reply_returns_none():
+    assert _parse_json_object("no json here") is None
+    assert _parse_json_object("prefix {not json} suffix") is None
+    assert _parse_json_object(None) is None
@@ -0,0 +1,27 @@
+import numpy as np
+
+from src.services.groq_pipeline_service import GroqPipelineService
+
+
+def _pcm(amplitude: float, seconds: float = 1.0) -> bytes:
+    noise = np.random.default_rng(0).standard_normal(int(16000 * seconds)) * amplitude
+    return noise.clip(-32768, 32767).astype(np.int16).tobytes()
+
+
+def test_quiet_buffer_is_silent_without_vad():
+    service = GroqPipelineService()
+    service.vad_service.is_speech_batch = lambda frames: (_ for _ in ()).throw(AssertionError("VAD called"))
+
+    assert service._is_silent(_pcm(100))
+    assert service._is_silent(b"")
+
+
+def test_voiced_fraction_decides_loud_buffers():
+    service = GroqPipelineService()
+    pcm = _pcm(5000)
+
+    service.vad_service.is_speech_batch = lambda frames: [False] * len(frames)
+    assert service._is_silent(pcm)
+
+    service.vad_service.is_speech_batch = lambda frames: [i % 10 == 0 for i in range(len(frames))]
+    assert not service._is_silent(pcm)
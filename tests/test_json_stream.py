@@ -0,0 +1,43 @@
+import json
+import pytest
+
+from src.infrastructure.ai.json_stream import iter_json_fields
+
+CASE = {
+    "title": "Fever \"and\" rash {",
+    "summary": {"chiefComplaint": "Fever", "vitals": "T: 39.5C"},
+    "differentialDiagnosis": ["Kawasaki Disease", "Measles"],
+    "score": -1.5e3,
+    "urgent": True,
+    "nelsonContext": None,
+}
+
+
+async def _chunks(text: str, size: int):
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 2, 7, 10000])
+async def test_fields_reassemble_original_object(size):
+    text = json.dumps(CASE, indent=2)
+
+    fields = [field async for field in iter_json_fields(_chunks(text, size))]
+
+    assert dict(fields) == CASE
+    assert [key for key, _ in fields] == list(CASE)
+
+
+@pytest.mark.asyncio
+async def test_truncated_stream_raises():
+    text = json.dumps(CASE)[:-10]
+
+    with pytest.raises(ValueError):
+        [field async for field in iter_json_fields(_chunks(text, 3))]
+
+
+@pytest.mark.asyncio
+async def test_non_object_raises():
+    with pytest.raises(ValueError):
+        [field async for field in iter_json_fields(_chunks("[1, 2]", 3))]
@@ -0,0 +1,39 @@
+import time
+
+import orjson
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from app.services.llm_service import UnifiedLLMService, _parse_llm_json
+
+
+def _final_response(llm_output: str) -> dict:
+    return UnifiedLLMService()._construct_final_response(
+        "query", "search", "model", time.time(), [{"pmid": "1"}], llm_output, False
+    )
+
+
+def test_analyze_case_partial_json():
+    assert _parse_llm_json('prefix {"title": "X", "results": []} suffix') == {"title": "X", "results": []}
+
+
+def test_plain_json_list_is_parsed_as_is():
+    assert _parse_llm_json('[{"title": "A"}]') == [{"title": "A"}]
+
+
+def test_unrecoverable_reply_raises():
+    with pytest.raises(orjson.JSONDecodeError):
+        _parse_llm_json("no json here")
+    with pytest.raises(orjson.JSONDecodeError):
+        _parse_llm_json("prefix {not json} suffix")
+
+
+def test_prose_wrapped_evidence_reply_keeps_results():
+    reply = 'Here are the findings:\n```json\n{"results": [{"title": "A"}]}\n```'
+
+    assert _final_response(reply)["results"] == [{"title": "A"}]
+
+
+def test_invalid_evidence_reply_returns_empty_results():
+    assert _final_response("Sorry, I cannot help with that.")["results"] == []
@@ -0,0 +1,49 @@
+from src.services.local_agreement import LocalAgreement
+
+
+def _words(*items):
+    return [{"word": w, "start": s, "end": e} for w, s, e in items]
+
+
+def test_first_hypothesis_commits_nothing():
+    agreement = LocalAgreement()
+
+    assert agreement.insert(_words(("hello", 0.0, 0.5), ("world", 0.5, 1.0)), offset=0.0) == []
+
+
+def test_commits_longest_common_prefix():
+    agreement = LocalAgreement()
+    agreement.insert(_words(("the", 0.0, 0.3), ("child", 0.3, 0.8), ("has", 0.8, 1.0)), offset=0.0)
+
+    committed = agreement.insert(
+        _words(("The", 0.0, 0.3), ("child", 0.3, 0.8), ("had", 0.8, 1.0), ("fever", 1.0, 1.5)),
+        offset=0.0,
+    )
+
+    assert [w["word"] for w in committed] == ["The", "child"]
+    assert agreement.committed_end == 0.8
+    assert [w["word"] for w in agreement.flush()] == ["had", "fever"]
+
+
+def test_offset_makes_timestamps_absolute_and_skips_committed_words():
+    agreement = LocalAgreement()
+    agreement.insert(_words(("a", 0.0, 1.0), ("b", 1.0, 2.0)), offset=0.0)
+    agreement.insert(_words(("a", 0.0, 1.0), ("b", 1.0, 2.0), ("c", 2.0, 3.0)), offset=0.0)
+
+    # Buffer was trimmed at 2.0s, so the next pass reports times relative to that
+    committed = agreement.insert(_words(("c", 0.0, 1.0), ("d", 1.0, 2.0)), offset=2.0)
+
+    assert committed == [{"word": "c", "start": 2.0, "end": 3.0}]
+    assert agreement.committed_end == 3.0
+
+
+def test_repeated_words_at_commit_boundary_are_dropped():
+    agreement = LocalAgreement()
+    agreement.insert(_words(("has", 0.0, 0.5), ("a", 0.5, 0.7), ("fever", 0.7, 1.2)), offset=0.0)
+    agreement.insert(_words(("has", 0.0, 0.5), ("a", 0.5, 0.7), ("fever", 0.7, 1.2)), offset=0.0)
+
+    # After trimming, the model re-hears "a fever" with timestamps past the commit
+    agreement.insert(_words(("a", 0.1, 0.3), ("fever", 0.3, 0.8), ("since", 0.8, 1.2)), offset=1.0)
+    committed = agreement.insert(_words(("a", 0.1, 0.3), ("fever", 0.3, 0.8), ("since", 0.8, 1.2)), offset=1.0)
+
+    assert [w["word"] for w in committed] == ["since"]
@@ -0,0 +1,30 @@
+import os
+import time
+
+from src.config.settings import settings
+from src.services.groq_pipeline_service import GroqPipelineService
+
+
+def _entry(directory, name, size, age):
+    path = directory / f"{name}.s16le"
+    path.write_bytes(bytes(size))
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+def test_eviction_drops_expired_then_least_recent(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PCM_CACHE_TTL", 100)
+    monkeypatch.setattr(settings, "PCM_CACHE_MAX_BYTES", 250)
+    expired = _entry(tmp_path, "expired", 10, age=200)
+    oldest = _entry(tmp_path, "oldest", 100, age=50)
+    middle = _entry(tmp_path, "middle", 100, age=20)
+    newest = _entry(tmp_path, "newest", 100, age=0)
+    unrelated = tmp_path / "other.tmp"
+    unrelated.write_bytes(b"x")
+
+    GroqPipelineService._evict_pcm_cache(str(tmp_path))
+
+    assert not expired.exists()
+    assert not oldest.exists()
+    assert middle.exists() and newest.exists() and unrelated.exists()
@@ -0,0 +1,37 @@
+import pytest
+
+from src.infrastructure.ai import factory
+from src.infrastructure.ai.factory import TranscriptionProviderFactory
+
+# Clears the process-wide provider cache
+pytestmark = pytest.mark.xdist_group("llm_factory")
+
+
+@pytest.fixture(autouse=True)
+def fresh_providers():
+    factory.get_provider.cache_clear()
+    yield
+    factory.get_provider.cache_clear()
+
+
+@pytest.mark.parametrize("name, env, expected_cls", [
+    ("groq", None, "GroqTranscriptionProvider"),
+    ("OpenAI", None, "OpenAITranscriptionProvider"),
+    ("gemini", None, "GeminiTranscriptionProvider"),
+    ("unknown", None, "GroqTranscriptionProvider"),
+    (None, "openai", "OpenAITranscriptionProvider"),
+    (None, None, "GroqTranscriptionProvider"),
+])
+def test_get_provider_resolution(monkeypatch, name, env, expected_cls):
+    if env is None:
+        monkeypatch.delenv("AI_PROVIDER", raising=False)
+    else:
+        monkeypatch.setenv("AI_PROVIDER", env)
+
+    provider = TranscriptionProviderFactory.get_provider(name)
+
+    assert type(provider).__name__ == expected_cls
+
+
+def test_get_provider_reuses_instances():
+    assert TranscriptionProviderFactory.get_provider("groq") is TranscriptionProviderFactory.get_provider("GROQ")
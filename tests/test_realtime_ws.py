@@ -4,9 +4,17 @@ from fastapi.testclient import TestClient
 
 from src.main import app
 
+pytestmark = pytest.mark.integration
 
-@pytest.fixture
+# Ten 100 ms frames of silence, batched into a single WebSocket message
+DUMMY_AUDIO = b"".join([bytes(3200)] * 10)
+
+
+@pytest.fixture(scope="session")
 def client():
+    # Each websocket_connect is an isolated connection, so one client serves
+    # every test. Not entered as a context manager: that would run the app's
+    # startup/shutdown hooks (init_db, Redis, AI client teardown).
     return TestClient(app)
 
 
@@ -16,23 +24,22 @@ def test_websocket_connect_and_disconnect(client: TestClient):
 
 
 def test_websocket_transcription_flow(client: TestClient):
-    dummy_audio = b"\x00" * 32000
-
     with patch("src.api.v1.endpoints.realtime.BufferManager") as mock_buffer_cls, patch(
-        "src.api.v1.endpoints.realtime.GroqService"
-    ) as mock_groq_cls:
+        "src.api.v1.endpoints.realtime.get_groq_service"
+    ) as mock_get_groq:
         mock_buffer = MagicMock()
-        mock_buffer.add_audio.return_value = dummy_audio
+        mock_buffer.add_audio.return_value = DUMMY_AUDIO
         mock_buffer_cls.return_value = mock_buffer
 
         mock_groq = MagicMock()
         mock_groq.transcribe = AsyncMock(return_value="stub transcription")
-        mock_groq_cls.return_value = mock_groq
+        mock_get_groq.return_value = mock_groq
 
         with client.websocket_connect("/api/v1/realtime") as websocket:
-            websocket.send_bytes(dummy_audio)
+            websocket.send_bytes(DUMMY_AUDIO)
             message = websocket.receive_json()
 
         assert message["type"] == "transcription"
         assert message["text"] == "stub transcription"
         assert message["partial"] is False
+        mock_buffer.add_audio.assert_called_once_with(DUMMY_AUDIO)
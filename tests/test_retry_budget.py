@@ -0,0 +1,82 @@
+import asyncio
+import groq
+import httpx
+import pytest
+from tenacity import wait_none
+
+from src.infrastructure.ai import _retry
+
+# Patches the shared retry policy and budget
+pytestmark = pytest.mark.xdist_group("ai_module_state")
+
+
+@pytest.fixture(autouse=True)
+def no_wait(monkeypatch):
+    monkeypatch.setattr(_retry._RETRY_POLICY, "wait", wait_none())
+
+
+@pytest.mark.asyncio
+async def test_retries_until_success():
+    calls = []
+
+    @_retry.retry_on_failure
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise httpx.ConnectError("down")
+        return "ok"
+
+    assert await flaky() == "ok"
+    assert len(calls) == 3
+    assert _retry._retries_in_flight[flaky.__module__] == 0
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_fails_fast(monkeypatch):
+    monkeypatch.setattr(_retry, "RETRY_BUDGET", 1)
+    release = asyncio.Event()
+    calls = {"slow": 0, "fast": 0}
+
+    @_retry.retry_on_failure
+    async def slow():
+        calls["slow"] += 1
+        if calls["slow"] == 1:
+            raise httpx.ConnectError("down")
+        await release.wait()
+        return "ok"
+
+    @_retry.retry_on_failure
+    async def fast():
+        calls["fast"] += 1
+        raise httpx.ConnectError("down")
+
+    retrying = asyncio.create_task(slow())
+    await asyncio.sleep(0.01)
+
+    # slow() holds the only retry slot, so fast() must not retry
+    with pytest.raises(httpx.ConnectError):
+        await fast()
+    assert calls["fast"] == 1
+
+    release.set()
+    assert await retrying == "ok"
+
+
+def _groq_status_error(status: int) -> groq.APIStatusError:
+    request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+    return groq.APIStatusError("error", response=httpx.Response(status, request=request), body=None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, expected_calls", [(400, 1), (401, 1), (429, 3), (503, 3)])
+async def test_only_transient_statuses_are_retried(status, expected_calls):
+    calls = []
+
+    @_retry.retry_on_failure
+    async def failing():
+        calls.append(1)
+        raise _groq_status_error(status)
+
+    with pytest.raises(groq.APIStatusError):
+        await failing()
+    assert len(calls) == expected_calls
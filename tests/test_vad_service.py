@@ -0,0 +1,37 @@
+import asyncio
+import numpy as np
+
+from src.infrastructure.ai.vad_service import VADService
+
+FRAME_SAMPLES = 480  # 30 ms at 16 kHz
+
+
+def _frame(amplitude: float, seed: int) -> bytes:
+    noise = np.random.default_rng(seed).standard_normal(FRAME_SAMPLES) * amplitude
+    return noise.clip(-32768, 32767).astype(np.int16).tobytes()
+
+
+def test_batch_matches_single_frame_decisions():
+    vad = VADService()
+    frames = [_frame(amp, i) for i, amp in enumerate((0, 50, 299, 301, 2000, 8000, 20000))]
+
+    expected = [asyncio.run(vad.is_speech(frame)) for frame in frames]
+
+    assert vad.is_speech_batch(frames) == expected
+
+
+def test_batch_skips_webrtc_for_quiet_frames():
+    vad = VADService()
+    checked = []
+    vad._vad_check = lambda frame: checked.append(frame) or True
+
+    result = vad.is_speech_batch([bytes(FRAME_SAMPLES * 2), _frame(5000, 1)])
+
+    assert result == [False, True]
+    assert len(checked) == 1
+
+
+def test_batch_handles_ragged_frames():
+    vad = VADService()
+
+    assert vad.is_speech_batch([bytes(960), bytes(640)]) == [False, False]
@@ -1,31 +1,36 @@
 import asyncio
 import os
-import requests
-import time
+import httpx
 import json
+from verify_endpoints import HTTP_LIMITS, poll_job
 
 # Configuration
 BASE_URL = "http://localhost:8000/api/v1"
 TEST_AUDIO_FILE = "uploads/test_audio.mp3"
 
 def create_dummy_audio():
+    if os.path.exists(TEST_AUDIO_FILE) and os.path.getsize(TEST_AUDIO_FILE) > 0:
+        return
     if not os.path.exists("uploads"):
         os.makedirs("uploads")
     # This is invalid audio content, which should trigger a provider error
     with open(TEST_AUDIO_FILE, "wb") as f:
         f.write(b"dummy audio content")
 
-def test_error_handling():
+def read_dummy_audio():
+    with open(TEST_AUDIO_FILE, "rb") as f:
+        return {"file": (os.path.basename(TEST_AUDIO_FILE), f.read())}
+
+async def run_error_handling(client: httpx.AsyncClient):
     print("\n🧪 Testing Error Handling (Invalid Audio File)...")
     
     # 1. Test Direct Transcription Error
     print("\n[1] Testing /audio/transcribe with invalid file...")
-    with open(TEST_AUDIO_FILE, "rb") as f:
-        response = requests.post(
-            f"{BASE_URL}/audio/transcribe",
-            files={"file": f},
-            data={"provider": "groq", "language": "fa"}
-        )
+    response = await client.post(
+        "/audio/transcribe",
+        files=read_dummy_audio(),
+        data={"provider": "groq", "language": "fa"}
+    )
     
     print(f"Status Code: {response.status_code}")
     print(f"Response Body: {response.text}")
@@ -42,37 +47,32 @@ def test_error_handling():
 
     # 2. Test Async Pipeline Error Propagation
     print("\n[2] Testing /audio/analyze with invalid file...")
-    with open(TEST_AUDIO_FILE, "rb") as f:
-        response = requests.post(
-            f"{BASE_URL}/audio/analyze",
-            files={"file": f}
-        )
+    response = await client.post(
+        "/audio/analyze",
+        files=read_dummy_audio()
+    )
     
     if response.status_code == 200:
         job_data = response.json()
         job_id = job_data["job_id"]
         print(f"✅ Job Started: {job_id}")
         
-        # Poll for status
-        for _ in range(10):
-            time.sleep(1)
-            status_res = requests.get(f"{BASE_URL}/audio/jobs/{job_id}")
-            status_data = status_res.json()
-            print(f"   Status: {status_data['status']}")
-            
-            if status_data["status"] == "failed":
-                print(f"✅ Job correctly marked as failed")
-                print(f"   Error Details: {status_data.get('error')}")
-                return
-            if status_data["status"] == "completed":
-                print("❌ Job unexpectedly completed with invalid file")
-                return
+        status_data = await poll_job(client, job_id)
+        if status_data.get("status") == "failed":
+            print(f"✅ Job correctly marked as failed")
+            print(f"   Error Details: {status_data.get('error')}")
+        elif status_data.get("status") == "completed":
+            print("❌ Job unexpectedly completed with invalid file")
     else:
         print(f"❌ Pipeline Start Failed: {response.text}")
 
+async def main():
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0, limits=HTTP_LIMITS) as client:
+        await run_error_handling(client)
+
 if __name__ == "__main__":
     create_dummy_audio()
     try:
-        test_error_handling()
+        asyncio.run(main())
     except Exception as e:
         print(f"Test Execution Failed: {e}")
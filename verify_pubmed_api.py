@@ -1,29 +1,67 @@
 import asyncio
+import hashlib
 import httpx
 import json
+import os
+import shelve
+import time
 
-async def test_endpoints():
-    async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
-        print("\n--- Testing Existing Backend Route ---")
-        try:
-            # Current Backend: /api/pubmed with {"text": "..."}
-            response = await client.post("/api/pubmed", json={"text": "asthma"})
-            print(f"POST /api/pubmed: {response.status_code}")
-            if response.status_code == 200:
-                print("Success Response:", response.json()['result'].get('metadata', {}))
-            else:
-                print("Error:", response.text)
-        except Exception as e:
-            print(f"Connection Failed: {e}")
-
-        print("\n--- Testing Frontend Expected Route ---")
-        try:
-            # Frontend Expectation: /api/v1/pubmed/search with {"query": "..."}
-            response = await client.post("/api/v1/pubmed/search", json={"query": "asthma"})
-            print(f"POST /api/v1/pubmed/search: {response.status_code}")
-            print("Response:", response.text[:200])
-        except Exception as e:
-            print(f"Connection Failed: {e}")
+# Always hits the server by default; USE_CACHE=1 reuses responses stored within the TTL
+CACHE_PATH = os.path.expanduser("~/.cache/verify_pubmed")
+CACHE_TTL = 600  # seconds
+
+# Keep idle connections around so the probes share them
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=30.0)
+
+async def cached_post(client: httpx.AsyncClient, path: str, json_body: dict, ttl: int = CACHE_TTL) -> httpx.Response:
+    key = hashlib.sha256(f"{path}\0{json.dumps(json_body, sort_keys=True)}".encode()).hexdigest()
+    use_cache = os.environ.get("USE_CACHE") == "1"
+    if use_cache:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with shelve.open(CACHE_PATH) as db:
+            entry = db.get(key)
+        if entry and time.time() - entry["stored_at"] < ttl:
+            print(f"X-Cache: HIT {path}")
+            return httpx.Response(entry["status_code"], text=entry["text"], headers={"content-type": "application/json"})
+
+    response = await client.post(path, json=json_body)
+    if use_cache:
+        print(f"X-Cache: MISS {path}")
+        if response.is_success:
+            with shelve.open(CACHE_PATH) as db:
+                db[key] = {"status_code": response.status_code, "text": response.text, "stored_at": time.time()}
+    return response
+
+async def probe_legacy(client: httpx.AsyncClient) -> list:
+    lines = ["\n--- Testing Existing Backend Route ---"]
+    try:
+        # Current Backend: /api/pubmed with {"text": "..."}
+        response = await cached_post(client, "/api/pubmed", {"text": "asthma"})
+        lines.append(f"POST /api/pubmed: {response.status_code}")
+        if response.status_code == 200:
+            lines.append(f"Success Response: {response.json()['result'].get('metadata', {})}")
+        else:
+            lines.append(f"Error: {response.text}")
+    except Exception as e:
+        lines.append(f"Connection Failed: {e}")
+    return lines
+
+async def probe_v1(client: httpx.AsyncClient) -> list:
+    lines = ["\n--- Testing Frontend Expected Route ---"]
+    try:
+        # Frontend Expectation: /api/v1/pubmed/search with {"query": "..."}
+        response = await cached_post(client, "/api/v1/pubmed/search", {"query": "asthma"})
+        lines.append(f"POST /api/v1/pubmed/search: {response.status_code}")
+        lines.append(f"Response: {response.text[:200]}")
+    except Exception as e:
+        lines.append(f"Connection Failed: {e}")
+    return lines
+
+async def run_endpoints():
+    async with httpx.AsyncClient(base_url="http://localhost:8000", timeout=10.0, limits=HTTP_LIMITS) as client:
+        # The probes are independent; run them concurrently and report in a fixed order
+        for lines in await asyncio.gather(probe_legacy(client), probe_v1(client)):
+            print("\n".join(lines))
 
 if __name__ == "__main__":
-    asyncio.run(test_endpoints())
\ No newline at end of file
+    asyncio.run(run_endpoints())